@@ -8,22 +8,44 @@ including connection errors, trading errors, data retrieval errors, and recovery
 from mymt5 import (
     MT5Client, MT5Account, MT5Symbol, MT5Data, MT5Trade, MT5Validator
 )
+import atexit
 import logging
+import logging.handlers
+import queue
+import random
+import threading
 import time
-from datetime import datetime
+import weakref
 import configparser
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import NamedTuple, Optional
 
 # Set up logging
+# Callers only enqueue records; file and console output happen on a listener thread
+_log_queue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler()
+_log_file_handler = logging.FileHandler('error_handling.log')
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_stream_handler.setFormatter(_log_formatter)
+_log_file_handler.setFormatter(_log_formatter)
+
+# The queue handler only renders the message; the listener's handlers add the prefix
+_log_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('error_handling.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[_log_queue_handler]
 )
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_file_handler, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+_BANNER = "=" * 50
+_SECTION_BANNER = "\n" + _BANNER
+
 
 # ==================== CONFIGURATION ====================
 
@@ -47,26 +69,53 @@ def load_config(config_file='config.ini'):
         return config
         
     except FileNotFoundError:
-        logger.error(f"Config file '{config_file}' not found")
+        logger.error("Config file '%s' not found", config_file)
         raise
     except configparser.Error as e:
-        logger.error(f"Error parsing config file: {e}")
+        logger.error("Error parsing config file: %s", e)
         raise
     except Exception as e:
-        logger.error(f"Unexpected error loading config: {e}")
+        logger.error("Unexpected error loading config: %s", e)
         raise
 
 
+# Expected transient failures; logged without a traceback
+_RETRYABLE_ERRORS = (TimeoutError, ConnectionError)
+
+
 # ==================== CONNECTION ERROR HANDLING ====================
 
-def connect_with_retry(client, max_attempts=3, delay=5, **credentials):
+def _sleep_backoff(attempt, max_attempts, base, max_backoff=60):
+    """
+    Sleep before the next retry using exponential backoff with full jitter
+    
+    Args:
+        attempt: Current attempt number (1-based)
+        max_attempts: Maximum number of attempts
+        base: Base delay in seconds
+        max_backoff: Upper bound for the backoff window in seconds
+    
+    Returns:
+        bool: True if another attempt follows, False if attempts are exhausted
+    """
+    if attempt >= max_attempts:
+        return False
+    
+    wait = random.uniform(0, min(max_backoff, base * (2 ** (attempt - 1))))
+    logger.info("Retrying in %.1f seconds...", wait)
+    time.sleep(wait)
+    return True
+
+
+def connect_with_retry(client, max_attempts=3, delay=5, max_backoff=60, **credentials):
     """
     Connect to MT5 with retry logic
     
     Args:
         client: MT5Client instance
         max_attempts: Maximum number of connection attempts
-        delay: Delay in seconds between attempts
+        delay: Base delay in seconds between attempts
+        max_backoff: Maximum delay in seconds between attempts
         **credentials: login, password, server
     
     Returns:
@@ -74,7 +123,7 @@ def connect_with_retry(client, max_attempts=3, delay=5, **credentials):
     """
     for attempt in range(1, max_attempts + 1):
         try:
-            logger.info(f"Connection attempt {attempt}/{max_attempts}")
+            logger.info("Connection attempt %d/%d", attempt, max_attempts)
             
             success = client.initialize(**credentials)
             
@@ -83,17 +132,12 @@ def connect_with_retry(client, max_attempts=3, delay=5, **credentials):
                 return True
             else:
                 error = client.get_error()
-                logger.warning(f"✗ Connection failed: {error}")
-                
-                if attempt < max_attempts:
-                    logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                logger.warning("✗ Connection failed: %s", error)
                     
         except Exception as e:
-            logger.error(f"Exception during connection: {e}")
-            if attempt < max_attempts:
-                logger.info(f"Retrying in {delay} seconds...")
-                time.sleep(delay)
+            logger.error("Exception during connection: %s", e)
+        
+        _sleep_backoff(attempt, max_attempts, delay, max_backoff)
     
     logger.error("All connection attempts failed")
     return False
@@ -125,6 +169,39 @@ def monitor_connection(client, check_interval=10):
 
 # ==================== TRADING ERROR HANDLING ====================
 
+class OrderRequest(NamedTuple):
+    """Order fields read by execute_trade_safely (other keys go straight to MT5Trade)"""
+    symbol: str
+    volume: Optional[float] = None
+    order_type: Optional[str] = None
+
+    @classmethod
+    def from_params(cls, order_params):
+        """Build a request from the known keys, ignoring MT5Trade-only ones (sl, tp, magic, ...)"""
+        return cls(**{k: v for k, v in order_params.items() if k in cls._fields})
+
+
+# Validators are reused per trade manager rather than rebuilt for every order
+_validators = weakref.WeakKeyDictionary()
+
+
+def _validator_for(trade):
+    """
+    Get the cached validator for a trade manager, creating it on first use
+    
+    Args:
+        trade: MT5Trade instance
+    
+    Returns:
+        MT5Validator: Validator bound to the trade manager's client
+    """
+    validator = _validators.get(trade)
+    if validator is None:
+        validator = MT5Validator(trade.client)
+        _validators[trade] = validator
+    return validator
+
+
 def execute_trade_safely(trade, **order_params):
     """
     Execute trade with comprehensive error handling
@@ -138,31 +215,32 @@ def execute_trade_safely(trade, **order_params):
     """
     try:
         # Validate parameters first
-        validator = MT5Validator(trade.client)
+        validator = _validator_for(trade)
         valid, error = validator.validate('trade_request', **order_params)
         
         if not valid:
-            logger.error(f"Validation failed: {error}")
+            logger.error("Validation failed: %s", error)
             return {
                 'success': False,
                 'error': f'Validation error: {error}'
             }
         
         # Execute trade
-        logger.info(f"Executing trade: {order_params['symbol']} {order_params.get('volume')}")
+        req = OrderRequest.from_params(order_params)
+        logger.info("Executing trade: %s %s", req.symbol, req.volume)
         
-        if order_params.get('order_type') in ['buy', 'BUY']:
+        if req.order_type in ('buy', 'BUY'):
             result = trade.buy(**order_params)
-        elif order_params.get('order_type') in ['sell', 'SELL']:
+        elif req.order_type in ('sell', 'SELL'):
             result = trade.sell(**order_params)
         else:
             result = trade.execute(**order_params)
         
         # Check result
         if result.get('success'):
-            logger.info(f"✓ Trade successful: Order {result.get('order')}")
+            logger.info("✓ Trade successful: Order %s", result.get('order'))
         else:
-            logger.error(f"✗ Trade failed: {result.get('error')}")
+            logger.error("✗ Trade failed: %s", result.get('error'))
             
             # Handle specific errors
             error_code = result.get('retcode')
@@ -190,7 +268,8 @@ def execute_trade_safely(trade, **order_params):
         return result
         
     except Exception as e:
-        logger.error(f"Exception during trade execution: {e}", exc_info=True)
+        exc_info = not isinstance(e, _RETRYABLE_ERRORS)
+        logger.error("Exception during trade execution: %s", e, exc_info=exc_info)
         return {
             'success': False,
             'error': f'Exception: {str(e)}'
@@ -213,22 +292,23 @@ def close_position_safely(trade, **close_params):
         if 'ticket' in close_params:
             positions = trade.get_positions(ticket=close_params['ticket'])
             if not positions:
-                logger.error(f"Position {close_params['ticket']} not found")
+                logger.error("Position %s not found", close_params['ticket'])
                 return {'success': False, 'error': 'Position not found'}
         
         # Attempt to close
-        logger.info(f"Closing position: {close_params}")
+        logger.info("Closing position: %s", close_params)
         result = trade.close_position(**close_params)
         
         if result.get('success'):
             logger.info("✓ Position closed successfully")
         else:
-            logger.error(f"✗ Failed to close position: {result.get('error')}")
+            logger.error("✗ Failed to close position: %s", result.get('error'))
         
         return result
         
     except Exception as e:
-        logger.error(f"Exception while closing position: {e}", exc_info=True)
+        exc_info = not isinstance(e, _RETRYABLE_ERRORS)
+        logger.error("Exception while closing position: %s", e, exc_info=exc_info)
         return {
             'success': False,
             'error': f'Exception: {str(e)}'
@@ -237,7 +317,8 @@ def close_position_safely(trade, **close_params):
 
 # ==================== DATA RETRIEVAL ERROR HANDLING ====================
 
-def get_data_safely(data_manager, symbol, timeframe, count=100, max_retries=3):
+def get_data_safely(data_manager, symbol, timeframe, count=100, max_retries=3,
+                    delay=2, max_backoff=60):
     """
     Get market data with retry logic
     
@@ -247,13 +328,17 @@ def get_data_safely(data_manager, symbol, timeframe, count=100, max_retries=3):
         timeframe: Timeframe
         count: Number of bars
         max_retries: Maximum number of retries
+        delay: Base delay in seconds between retries
+        max_backoff: Maximum delay in seconds between retries
     
     Returns:
         DataFrame or None
     """
     for attempt in range(1, max_retries + 1):
         try:
-            logger.info(f"Fetching data for {symbol} {timeframe} (attempt {attempt}/{max_retries})")
+            logger.info(
+                "Fetching data for %s %s (attempt %d/%d)", symbol, timeframe, attempt, max_retries
+            )
             
             bars = data_manager.get_bars(
                 symbol=symbol,
@@ -262,22 +347,58 @@ def get_data_safely(data_manager, symbol, timeframe, count=100, max_retries=3):
             )
             
             if bars is None or bars.empty:
-                logger.warning(f"No data returned for {symbol}")
-                if attempt < max_retries:
-                    time.sleep(2)
+                logger.warning("No data returned for %s", symbol)
+                if _sleep_backoff(attempt, max_retries, delay, max_backoff):
                     continue
                 return None
             
-            logger.info(f"✓ Retrieved {len(bars)} bars")
+            logger.info("✓ Retrieved %d bars", len(bars))
             return bars
             
         except Exception as e:
-            logger.error(f"Exception fetching data: {e}")
-            if attempt < max_retries:
-                time.sleep(2)
-            else:
-                logger.error("Max retries reached")
+            # Only the final failure is worth a traceback
+            if attempt >= max_retries:
+                logger.exception("Exception fetching data, max retries reached: %s", e)
                 return None
+            logger.warning("Exception fetching data (attempt %d): %s", attempt, e)
+            _sleep_backoff(attempt, max_retries, delay, max_backoff)
+
+
+def get_data_bulk_safely(data_manager, symbols, timeframe, count=100, max_retries=3,
+                         max_workers=8):
+    """
+    Get market data for several symbols concurrently with retry logic
+    
+    Args:
+        data_manager: MT5Data instance
+        symbols: List of symbol names
+        timeframe: Timeframe
+        count: Number of bars
+        max_retries: Maximum number of retries per symbol
+        max_workers: Maximum number of concurrent fetches
+    
+    Returns:
+        dict: Symbol name mapped to DataFrame or None
+    """
+    def _fetch_one(symbol):
+        return get_data_safely(data_manager, symbol, timeframe, count, max_retries)
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_fetch_one, symbol): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                results[symbol] = future.result()
+            except Exception as e:
+                logger.error("Exception fetching data for %s: %s", symbol, e)
+                results[symbol] = None
+    
+    return results
+
+
+# Symbols already selected in Market Watch during this session
+_initialized_symbols = set()
 
 
 def get_symbol_info_safely(symbol_manager, symbol):
@@ -292,24 +413,50 @@ def get_symbol_info_safely(symbol_manager, symbol):
         dict or None
     """
     try:
-        # Initialize symbol first
-        symbol_manager.initialize(symbol)
+        # Initialize symbol first (only once per session)
+        if symbol not in _initialized_symbols and symbol_manager.initialize(symbol):
+            _initialized_symbols.add(symbol)
         
         # Check if symbol exists
         if not symbol_manager.check(symbol, 'exists'):
-            logger.error(f"Symbol '{symbol}' does not exist")
+            logger.error("Symbol '%s' does not exist", symbol)
             return None
         
         # Get symbol info
         info = symbol_manager.get_info(symbol)
-        logger.info(f"✓ Retrieved info for {symbol}")
+        logger.info("✓ Retrieved info for %s", symbol)
         return info
         
     except Exception as e:
-        logger.error(f"Exception getting symbol info: {e}", exc_info=True)
+        exc_info = not isinstance(e, _RETRYABLE_ERRORS)
+        logger.error("Exception getting symbol info: %s", e, exc_info=exc_info)
         return None
 
 
+def get_symbol_info_bulk(symbol_manager, symbols, max_workers=8):
+    """
+    Get symbol information for several symbols concurrently
+    
+    Args:
+        symbol_manager: MT5Symbol instance
+        symbols: List of symbol names
+        max_workers: Maximum number of concurrent lookups
+    
+    Returns:
+        dict: Symbol name mapped to info dict or None
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(get_symbol_info_safely, symbol_manager, symbol): symbol
+            for symbol in dict.fromkeys(symbols)
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    return results
+
+
 # ==================== ACCOUNT ERROR HANDLING ====================
 
 def check_account_health(account_manager):
@@ -328,21 +475,22 @@ def check_account_health(account_manager):
         equity = account_manager.get('equity')
         margin_free = account_manager.get('margin_free')
         
-        logger.info(f"Account - Balance: ${balance}, Equity: ${equity}")
+        logger.info("Account - Balance: $%s, Equity: $%s", balance, equity)
         
         # Calculate health metrics
         health = account_manager.calculate('health')
         
         if health['status'] != 'healthy':
-            logger.warning(f"Account health: {health['status']}")
-            logger.warning(f"Margin level: {health['margin_level']}")
+            logger.warning("Account health: %s", health['status'])
+            logger.warning("Margin level: %s", health['margin_level'])
         else:
             logger.info("✓ Account is healthy")
         
         return health
         
     except Exception as e:
-        logger.error(f"Exception checking account health: {e}", exc_info=True)
+        exc_info = not isinstance(e, _RETRYABLE_ERRORS)
+        logger.error("Exception checking account health: %s", e, exc_info=exc_info)
         return None
 
 
@@ -352,12 +500,13 @@ def trading_session_with_error_handling():
     """Complete trading session with comprehensive error handling"""
     
     client = None
+    session_start = time.perf_counter()
     
     try:
         # 1. Load configuration
-        logger.info("="*50)
+        logger.info(_BANNER)
         logger.info("STARTING TRADING SESSION")
-        logger.info("="*50)
+        logger.info(_BANNER)
         
         config = load_config()
         
@@ -370,11 +519,16 @@ def trading_session_with_error_handling():
         client.set_retry_delay(3)
         
         # Register event handlers
-        def on_connect(c):
+        # The disconnect handler wakes the monitoring loop immediately
+        disconnect_event = threading.Event()
+        
+        def on_connect(client, **kwargs):
             logger.info("EVENT: Connected to MT5")
+            disconnect_event.clear()
         
-        def on_disconnect(c):
+        def on_disconnect(client, **kwargs):
             logger.warning("EVENT: Disconnected from MT5")
+            disconnect_event.set()
         
         client.on('connect', on_connect)
         client.on('disconnect', on_disconnect)
@@ -401,9 +555,9 @@ def trading_session_with_error_handling():
         trade_manager = MT5Trade(client, symbol_manager=symbol_manager)
         
         # 4. Check account health
-        logger.info("\n" + "="*50)
+        logger.info(_SECTION_BANNER)
         logger.info("CHECKING ACCOUNT HEALTH")
-        logger.info("="*50)
+        logger.info(_BANNER)
         
         health = check_account_health(account)
         if not health or health['status'] != 'healthy':
@@ -411,20 +565,20 @@ def trading_session_with_error_handling():
             return
         
         # 5. Get symbol information
-        logger.info("\n" + "="*50)
+        logger.info(_SECTION_BANNER)
         logger.info("GETTING SYMBOL INFORMATION")
-        logger.info("="*50)
+        logger.info(_BANNER)
         
         symbol = 'EURUSD'
         symbol_info = get_symbol_info_safely(symbol_manager, symbol)
         if not symbol_info:
-            logger.error(f"Failed to get info for {symbol}")
+            logger.error("Failed to get info for %s", symbol)
             return
         
         # 6. Get market data
-        logger.info("\n" + "="*50)
+        logger.info(_SECTION_BANNER)
         logger.info("GETTING MARKET DATA")
-        logger.info("="*50)
+        logger.info(_BANNER)
         
         bars = get_data_safely(data_manager, symbol, 'H1', count=100)
         if bars is None:
@@ -432,9 +586,9 @@ def trading_session_with_error_handling():
             return
         
         # 7. Execute a test trade (commented out for safety)
-        logger.info("\n" + "="*50)
+        logger.info(_SECTION_BANNER)
         logger.info("TRADE EXECUTION (DRY RUN)")
-        logger.info("="*50)
+        logger.info(_BANNER)
         
         # Get current price
         current_price = symbol_manager.get_price(symbol, 'ask')
@@ -449,45 +603,47 @@ def trading_session_with_error_handling():
             'order_type': 'buy'
         }
         
-        logger.info(f"Trade params: {trade_params}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Trade params: %s", trade_params)
         logger.info("NOTE: Actual execution is commented out for safety")
         
         # Uncomment to execute real trade:
         # result = execute_trade_safely(trade_manager, **trade_params)
         
         # 8. Monitor for errors
-        logger.info("\n" + "="*50)
+        logger.info(_SECTION_BANNER)
         logger.info("SESSION RUNNING (Press Ctrl+C to stop)")
-        logger.info("="*50)
+        logger.info(_BANNER)
         
-        # Monitor connection and account
-        check_count = 0
-        while True:
-            time.sleep(10)
-            check_count += 1
-            
+        # Monitor connection and account: an explicit disconnect wakes the loop
+        # immediately, but a dropped terminal fires no event, so keep polling
+        # the connection every 10 seconds and check account health every minute
+        next_health_check = time.monotonic() + 60
+        while not disconnect_event.wait(timeout=10):
             # Check connection
             if not client.is_connected():
-                logger.warning("Connection lost during monitoring")
                 break
             
             # Periodic account check
-            if check_count % 6 == 0:  # Every minute
+            if time.monotonic() >= next_health_check:
+                next_health_check += 60
                 health = check_account_health(account)
                 if not health or health['status'] != 'healthy':
                     logger.warning("Account health deteriorated")
         
+        logger.warning("Connection lost during monitoring")
+        
     except KeyboardInterrupt:
         logger.info("\nSession interrupted by user")
         
     except Exception as e:
-        logger.error(f"Unexpected error in trading session: {e}", exc_info=True)
+        logger.error("Unexpected error in trading session: %s", e, exc_info=True)
         
     finally:
         # Cleanup
-        logger.info("\n" + "="*50)
+        logger.info(_SECTION_BANNER)
         logger.info("CLEANING UP")
-        logger.info("="*50)
+        logger.info(_BANNER)
         
         if client:
             try:
@@ -503,11 +659,11 @@ def trading_session_with_error_handling():
                 logger.info("✓ Disconnected successfully")
                 
             except Exception as e:
-                logger.error(f"Error during cleanup: {e}")
+                logger.error("Error during cleanup: %s", e)
         
-        logger.info("="*50)
-        logger.info("SESSION ENDED")
-        logger.info("="*50)
+        logger.info(_BANNER)
+        logger.info("SESSION ENDED (%.1fs)", time.perf_counter() - session_start)
+        logger.info(_BANNER)
 
 
 # ==================== MAIN ====================
@@ -534,7 +690,7 @@ if __name__ == '__main__':
     try:
         trading_session_with_error_handling()
     except Exception as e:
-        logger.critical(f"Critical error: {e}", exc_info=True)
+        logger.critical("Critical error: %s", e, exc_info=True)
         print(f"\n⚠️  Critical error occurred: {e}")
         print("Check error_handling.log for details")
 
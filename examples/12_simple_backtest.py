@@ -5,11 +5,43 @@ This example demonstrates how to backtest a trading strategy using historical da
 from MT5. It includes a simple moving average crossover strategy as an example.
 """
 
-from mymt5 import MT5Client, MT5Data, MT5Symbol, MT5Utils
+from mymt5 import MT5Client, MT5Data, MT5Utils
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import configparser
+import itertools
+from dataclasses import dataclass
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the simulation then runs as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+try:
+    import polars as pl
+except ImportError:  # Polars is optional; trades are then exported with pandas
+    pl = None
+
+
+# Position directions
+LONG = 1
+SHORT = -1
+FLAT = 0
+
+# Signal codes
+BUY = 1
+SELL = -1
+HOLD = 0
+
+# Account currency per unit of price move per lot: 10000 pips per unit of
+# price at $10 per pip for 1 standard lot
+PIP_MULTIPLIER = 10000 * 10
 
 
 # ==================== BACKTEST FRAMEWORK ====================
@@ -17,7 +49,22 @@ import configparser
 class Backtest:
     """Simple backtesting framework for MT5 strategies"""
     
-    def __init__(self, initial_balance=10000.0, risk_per_trade=0.01, commission=0.0001):
+    # Per-position columns and their dtypes (one array per column)
+    _COLUMNS = {
+        'entry_time': 'datetime64[ns]',
+        'entry_price': np.float64,
+        'direction': np.int8,  # +1 long, -1 short
+        'stop_loss': np.float64,
+        'take_profit': np.float64,
+        'lot_size': np.float64,
+        'exit_time': 'datetime64[ns]',
+        'exit_price': np.float64,
+        'profit': np.float64,
+        'open': bool,
+    }
+    
+    def __init__(self, initial_balance=10000.0, risk_per_trade=0.01, commission=0.0001,
+                 capacity=1024):
         """
         Initialize backtest
         
@@ -25,6 +72,7 @@ class Backtest:
             initial_balance: Starting account balance
             risk_per_trade: Risk per trade as fraction of balance (0.01 = 1%)
             commission: Commission per trade (0.0001 = 1 pip)
+            capacity: Number of positions to preallocate storage for
         """
         self.initial_balance = initial_balance
         self.risk_per_trade = risk_per_trade
@@ -33,96 +81,173 @@ class Backtest:
         # Track results
         self.balance = initial_balance
         self.equity = initial_balance
-        self.trades = []
-        self.positions = []
+        
+        # Positions are stored column-wise; closed positions are trades
+        self._n_positions = 0
+        self._n_trades = 0
+        self._open_idx = set()  # Indices of currently open positions
+        self._allocate(max(int(capacity), 1))
+        self._invalidate_results()
+    
+    def _allocate(self, capacity):
+        """Allocate (or grow) the position arrays to the given capacity"""
+        n = self._n_positions
+        for name, dtype in self._COLUMNS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if n:
+                array[:n] = getattr(self, '_' + name)[:n]
+            setattr(self, '_' + name, array)
+        
+        # Position index of each trade, in closing order
+        trade_order = np.empty(capacity, dtype=np.int64)
+        if self._n_trades:
+            trade_order[:self._n_trades] = self._trade_order[:self._n_trades]
+        self._trade_order = trade_order
         
     def open_position(self, entry_time, entry_price, direction, stop_loss, take_profit, lot_size):
-        """Open a position"""
-        position = {
-            'entry_time': entry_time,
-            'entry_price': entry_price,
-            'direction': direction,  # 'long' or 'short'
-            'stop_loss': stop_loss,
-            'take_profit': take_profit,
-            'lot_size': lot_size,
-            'open': True
-        }
-        self.positions.append(position)
-        return len(self.positions) - 1  # Return position index
+        """Open a position (direction is LONG or SHORT)"""
+        idx = self._n_positions
+        if idx == len(self._open):
+            self._allocate(2 * idx)
+        
+        self._entry_time[idx] = entry_time
+        self._entry_price[idx] = entry_price
+        self._direction[idx] = direction
+        self._stop_loss[idx] = stop_loss
+        self._take_profit[idx] = take_profit
+        self._lot_size[idx] = lot_size
+        self._open[idx] = True
+        self._open_idx.add(idx)
+        
+        self._n_positions += 1
+        return idx  # Return position index
+    
+    def is_open(self, position_idx):
+        """Check whether a position is still open"""
+        return bool(self._open[position_idx])
     
     def close_position(self, position_idx, exit_time, exit_price):
         """Close a position and record trade"""
-        position = self.positions[position_idx]
-        
-        if not position['open']:
+        if not self._open[position_idx]:
             return  # Already closed
         
-        # Calculate profit/loss
-        if position['direction'] == 'long':
-            price_diff = exit_price - position['entry_price']
-        else:  # short
-            price_diff = position['entry_price'] - exit_price
-        
-        # Calculate profit in account currency (assuming 1 pip = $10 for standard lot)
-        pip_value = 10  # $10 per pip for 1 standard lot
-        profit = price_diff * 10000 * position['lot_size'] * pip_value  # Convert to pips
-        
-        # Subtract commission
-        commission_cost = self.commission * 10000 * position['lot_size'] * pip_value * 2  # Entry + exit
-        profit -= commission_cost
+        # Calculate profit/loss net of commission (charged on entry and exit)
+        price_diff = self._direction[position_idx] * (exit_price - self._entry_price[position_idx])
+        lot_size = self._lot_size[position_idx]
+        profit = lot_size * PIP_MULTIPLIER * (price_diff - 2.0 * self.commission)
         
         # Update balance
         self.balance += profit
         
-        # Record trade
-        trade = {
-            'entry_time': position['entry_time'],
-            'exit_time': exit_time,
-            'entry_price': position['entry_price'],
-            'exit_price': exit_price,
-            'direction': position['direction'],
-            'lot_size': position['lot_size'],
-            'profit': profit,
-            'balance': self.balance
-        }
-        self.trades.append(trade)
+        # Record trade and mark position as closed
+        self._open[position_idx] = False
+        self._open_idx.discard(position_idx)
+        self._exit_time[position_idx] = exit_time
+        self._exit_price[position_idx] = exit_price
+        self._profit[position_idx] = profit
+        self._trade_order[self._n_trades] = position_idx
+        self._n_trades += 1
+        self._invalidate_results()
+    
+    def record_trades(self, entry_times, entry_prices, directions, stop_losses, take_profits,
+                      lot_size, exit_times, exit_prices, profits):
+        """
+        Record a batch of already-closed trades, e.g. from a simulation kernel
         
-        # Mark position as closed
-        position['open'] = False
-        position['exit_time'] = exit_time
-        position['exit_price'] = exit_price
-        position['profit'] = profit
+        Args:
+            entry_times, entry_prices: Entry bar times and prices
+            directions: +1 for long, -1 for short
+            stop_losses, take_profits: Stop levels of each trade
+            lot_size: Lot size (scalar or per trade)
+            exit_times, exit_prices: Exit bar times and prices
+            profits: Net profit of each trade
+        """
+        count = len(profits)
+        start = self._n_positions
+        end = start + count
+        if end > len(self._open):
+            self._allocate(max(end, 2 * len(self._open)))
+        
+        self._entry_time[start:end] = entry_times
+        self._entry_price[start:end] = entry_prices
+        self._direction[start:end] = directions
+        self._stop_loss[start:end] = stop_losses
+        self._take_profit[start:end] = take_profits
+        self._lot_size[start:end] = lot_size
+        self._exit_time[start:end] = exit_times
+        self._exit_price[start:end] = exit_prices
+        self._profit[start:end] = profits
+        self._open[start:end] = False
+        self.balance += np.sum(profits)
+        
+        self._trade_order[self._n_trades:self._n_trades + count] = np.arange(start, end)
+        self._n_positions = end
+        self._n_trades += count
+        self._invalidate_results()
     
     def check_stops(self, current_time, high, low):
         """Check if any positions hit stop loss or take profit"""
-        for idx, position in enumerate(self.positions):
-            if not position['open']:
-                continue
-            
-            if position['direction'] == 'long':
-                # Check stop loss
-                if low <= position['stop_loss']:
-                    self.close_position(idx, current_time, position['stop_loss'])
-                # Check take profit
-                elif high >= position['take_profit']:
-                    self.close_position(idx, current_time, position['take_profit'])
-            else:  # short
-                # Check stop loss
-                if high >= position['stop_loss']:
-                    self.close_position(idx, current_time, position['stop_loss'])
-                # Check take profit
-                elif low <= position['take_profit']:
-                    self.close_position(idx, current_time, position['take_profit'])
+        if not self._open_idx:
+            return
+        open_idx = np.fromiter(self._open_idx, dtype=np.int64, count=len(self._open_idx))
+        
+        # Negate short-side prices so both directions use the same comparisons
+        direction = self._direction[open_idx]
+        adverse = np.where(direction > 0, low, -high)
+        favorable = np.where(direction > 0, high, -low)
+        hit_sl = adverse <= direction * self._stop_loss[open_idx]
+        hit_tp = favorable >= direction * self._take_profit[open_idx]
+        
+        # Stop loss takes precedence when both levels are touched
+        hit = hit_sl | hit_tp
+        for idx, sl_first in zip(open_idx[hit], hit_sl[hit]):
+            exit_price = self._stop_loss[idx] if sl_first else self._take_profit[idx]
+            self.close_position(idx, current_time, exit_price)
     
     def close_all_positions(self, exit_time, exit_price):
         """Close all open positions"""
-        for idx, position in enumerate(self.positions):
-            if position['open']:
-                self.close_position(idx, exit_time, exit_price)
-    
-    def get_results(self):
-        """Calculate and return backtest results"""
-        if not self.trades:
+        for idx in sorted(self._open_idx):
+            self.close_position(idx, exit_time, exit_price)
+    
+    def _invalidate_results(self):
+        """Drop cached results after the set of trades changes"""
+        self._results_cache = None
+        self._trades_df_cache = None
+        self._equity_curve_cache = None
+    
+    @property
+    def equity_curve(self):
+        """Balance after each closed trade, as a cumulative sum of trade profits"""
+        if self._equity_curve_cache is None:
+            profits = self._profit[self._trade_order[:self._n_trades]]
+            self._equity_curve_cache = self.initial_balance + np.cumsum(profits)
+        return self._equity_curve_cache
+    
+    def get_trades_df(self):
+        """Closed trades as a DataFrame, built from the position columns"""
+        if self._trades_df_cache is None:
+            order = self._trade_order[:self._n_trades]
+            self._trades_df_cache = pd.DataFrame({
+                'entry_time': self._entry_time[order],
+                'exit_time': self._exit_time[order],
+                'entry_price': self._entry_price[order],
+                'exit_price': self._exit_price[order],
+                'direction': np.where(self._direction[order] == LONG, 'long', 'short'),
+                'lot_size': self._lot_size[order],
+                'profit': self._profit[order],
+                'balance': self.equity_curve,
+            })
+        return self._trades_df_cache
+    
+    def get_metrics(self):
+        """Calculate and return the scalar backtest metrics"""
+        if self._results_cache is None:
+            self._results_cache = self._calculate_metrics()
+        return dict(self._results_cache)
+    
+    def _calculate_metrics(self):
+        """Calculate the scalar backtest metrics from the position columns"""
+        if not self._n_trades:
             return {
                 'total_trades': 0,
                 'winning_trades': 0,
@@ -135,41 +260,98 @@ class Backtest:
                 'avg_win': 0,
                 'avg_loss': 0,
                 'largest_win': 0,
-                'largest_loss': 0
+                'largest_loss': 0,
+                'max_drawdown': 0
             }
         
-        # Convert trades to DataFrame
-        trades_df = pd.DataFrame(self.trades)
+        # Calculate metrics from masked views of the profit column
+        profits = self._profit[self._trade_order[:self._n_trades]]
+        wins = profits[profits > 0]
+        losses = profits[profits < 0]
+        n_winning = len(wins)
+        n_losing = len(losses)
         
-        # Calculate metrics
-        winning_trades = trades_df[trades_df['profit'] > 0]
-        losing_trades = trades_df[trades_df['profit'] < 0]
+        gross_profit = wins.sum()
+        gross_loss = -losses.sum()
         
-        total_profit = trades_df['profit'].sum()
-        gross_profit = winning_trades['profit'].sum() if len(winning_trades) > 0 else 0
-        gross_loss = abs(losing_trades['profit'].sum()) if len(losing_trades) > 0 else 0
+        # Drawdown from the running peak (the initial balance counts as a peak)
+        equity = self.equity_curve
+        drawdown = np.maximum.accumulate(np.maximum(equity, self.initial_balance)) - equity
         
-        results = {
-            'total_trades': len(self.trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
-            'win_rate': (len(winning_trades) / len(self.trades)) * 100,
-            'total_profit': total_profit,
+        return {
+            'total_trades': self._n_trades,
+            'winning_trades': n_winning,
+            'losing_trades': n_losing,
+            'win_rate': (n_winning / self._n_trades) * 100,
+            'total_profit': profits.sum(),
             'final_balance': self.balance,
             'return_pct': ((self.balance - self.initial_balance) / self.initial_balance) * 100,
             'profit_factor': gross_profit / gross_loss if gross_loss > 0 else 0,
-            'avg_win': winning_trades['profit'].mean() if len(winning_trades) > 0 else 0,
-            'avg_loss': losing_trades['profit'].mean() if len(losing_trades) > 0 else 0,
-            'largest_win': winning_trades['profit'].max() if len(winning_trades) > 0 else 0,
-            'largest_loss': losing_trades['profit'].min() if len(losing_trades) > 0 else 0,
-            'trades_df': trades_df
+            'avg_win': wins.mean() if n_winning > 0 else 0,
+            'avg_loss': losses.mean() if n_losing > 0 else 0,
+            'largest_win': wins.max() if n_winning > 0 else 0,
+            'largest_loss': losses.min() if n_losing > 0 else 0,
+            'max_drawdown': drawdown.max(),
         }
+    
+    def grid_search(self, strategy_cls, param_grid, highs, lows, closes,
+                    sl_long, tp_long, sl_short, tp_short, lot_size):
+        """
+        Backtest every parameter combination of an MA crossover strategy
+        
+        The combinations are simulated in parallel by grid_backtest; the
+        backtest's own trade record is left untouched.
+        
+        Args:
+            strategy_cls: Strategy class taking fast_period / slow_period
+            param_grid: Dict mapping 'fast_period' / 'slow_period' to lists of values
+            highs, lows, closes: Bar prices
+            sl_long, tp_long: Stop loss / take profit levels for a long entry at each bar
+            sl_short, tp_short: Stop loss / take profit levels for a short entry at each bar
+            lot_size: Lot size per trade
+        
+        Returns:
+            DataFrame: One row per combination with final balance, Sharpe ratio and trade count
+        """
+        names = list(param_grid)
+        combos = [dict(zip(names, values))
+                  for values in itertools.product(*(param_grid[name] for name in names))]
+        strategies = [strategy_cls(**params) for params in combos]
+        fast_grid = np.array([strategy.fast_period for strategy in strategies], dtype=np.int64)
+        slow_grid = np.array([strategy.slow_period for strategy in strategies], dtype=np.int64)
+        
+        final_balance, sharpe, total_trades = grid_backtest(
+            highs, lows, closes, fast_grid, slow_grid, sl_long, tp_long,
+            sl_short, tp_short, lot_size, self.commission, self.initial_balance
+        )
         
+        results = pd.DataFrame(combos)
+        results['final_balance'] = final_balance
+        results['sharpe'] = sharpe
+        results['total_trades'] = total_trades
         return results
     
-    def print_results(self):
-        """Print formatted backtest results"""
-        results = self.get_results()
+    def get_results(self, include_trades=True):
+        """
+        Calculate and return backtest results
+        
+        Args:
+            include_trades: Whether to add the trades DataFrame as 'trades_df'
+        """
+        results = self.get_metrics()
+        if include_trades and self._n_trades:
+            results['trades_df'] = self.get_trades_df()
+        return results
+    
+    def print_results(self, results=None):
+        """
+        Print formatted backtest results
+        
+        Args:
+            results: Precomputed results from get_results() (computed if None)
+        """
+        if results is None:
+            results = self.get_metrics()
         
         print("\n" + "="*60)
         print("BACKTEST RESULTS")
@@ -189,11 +371,182 @@ class Backtest:
         print(f"Average Loss:       ${results['avg_loss']:,.2f}")
         print(f"Largest Win:        ${results['largest_win']:,.2f}")
         print(f"Largest Loss:       ${results['largest_loss']:,.2f}")
+        print(f"Max Drawdown:       ${results['max_drawdown']:,.2f}")
         print("="*60)
 
 
 # ==================== STRATEGY EXAMPLE: MA CROSSOVER ====================
 
+def _fast_sma(values, period):
+    """Simple moving average via a cumulative sum (NaN until the window is full)"""
+    sma = np.full(len(values), np.nan)
+    if period <= len(values):
+        csum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+        sma[period - 1:] = (csum[period:] - csum[:-period]) / period
+    return sma
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def run_ma_crossover_backtest(highs, lows, closes, fast_n, slow_n, sl_long, tp_long,
+                              sl_short, tp_short, lot, commission):
+    """
+    Backtest the MA crossover strategy in a single pass over the bars
+    
+    The fast/slow moving averages are maintained as rolling sums, crossovers are
+    detected against the previous bar, and the resulting signals drive the
+    position state machine in the same loop. A signal closes any open position
+    at the bar's close and opens a new one in the signal's direction. Stops are
+    checked from the bar after entry onwards, with the stop loss taking
+    precedence when both levels are touched on a bar.
+    
+    Args:
+        highs, lows, closes: Bar prices
+        fast_n, slow_n: Fast and slow MA periods
+        sl_long, tp_long: Stop loss / take profit levels for a long entry at each bar
+        sl_short, tp_short: Stop loss / take profit levels for a short entry at each bar
+        lot: Lot size per trade
+        commission: Commission per side in price units
+    
+    Returns:
+        tuple: Per-trade arrays (entry_idx, exit_idx, direction, stop_loss,
+        take_profit, exit_price, profit)
+    """
+    n = closes.shape[0]
+    entry_idx = np.empty(n, dtype=np.int64)
+    exit_idx = np.empty(n, dtype=np.int64)
+    direction = np.empty(n, dtype=np.int8)
+    stop_loss = np.empty(n, dtype=np.float64)
+    take_profit = np.empty(n, dtype=np.float64)
+    exit_price = np.empty(n, dtype=np.float64)
+    profit = np.empty(n, dtype=np.float64)
+    
+    lot_value = lot * PIP_MULTIPLIER
+    commission_cost = 2.0 * commission  # Entry + exit
+    
+    # Crossovers need both averages on the previous and the current bar
+    first_signal_bar = max(fast_n, slow_n)
+    
+    fast_sum = 0.0
+    slow_sum = 0.0
+    prev_fast = 0.0
+    prev_slow = 0.0
+    last_cross = FLAT
+    
+    k = 0
+    pos_dir = FLAT
+    pos_entry = 0.0
+    pos_sl = 0.0
+    pos_tp = 0.0
+    for i in range(n):
+        # Update the moving averages
+        fast_sum += closes[i]
+        if i >= fast_n:
+            fast_sum -= closes[i - fast_n]
+        slow_sum += closes[i]
+        if i >= slow_n:
+            slow_sum -= closes[i - slow_n]
+        cur_fast = fast_sum / fast_n
+        cur_slow = slow_sum / slow_n
+        
+        # Check stops for the open position; short prices are negated so both
+        # directions share one comparison path
+        if pos_dir != FLAT:
+            is_long = pos_dir == LONG
+            adverse = lows[i] if is_long else -highs[i]
+            favorable = highs[i] if is_long else -lows[i]
+            hit_sl = adverse <= pos_dir * pos_sl
+            hit_tp = favorable >= pos_dir * pos_tp
+            if hit_sl or hit_tp:
+                exit_at = pos_sl if hit_sl else pos_tp
+                exit_idx[k] = i
+                exit_price[k] = exit_at
+                profit[k] = lot_value * (pos_dir * (exit_at - pos_entry) - commission_cost)
+                k += 1
+                pos_dir = FLAT
+        
+        # Detect crossovers; only a change of direction produces a signal
+        sig = HOLD
+        if i >= first_signal_bar:
+            cross = HOLD
+            if prev_fast <= prev_slow and cur_fast > cur_slow:
+                cross = BUY
+            elif prev_fast >= prev_slow and cur_fast < cur_slow:
+                cross = SELL
+            if cross != HOLD and cross != last_cross:
+                sig = cross
+                last_cross = cross
+        prev_fast = cur_fast
+        prev_slow = cur_slow
+        
+        if sig == HOLD:
+            continue
+        
+        # Close the current position on the opposite signal
+        if pos_dir != FLAT:
+            exit_idx[k] = i
+            exit_price[k] = closes[i]
+            profit[k] = lot_value * (pos_dir * (closes[i] - pos_entry) - commission_cost)
+            k += 1
+        
+        # Open the new position
+        pos_dir = LONG if sig == BUY else SHORT
+        pos_entry = closes[i]
+        pos_sl = sl_long[i] if pos_dir == LONG else sl_short[i]
+        pos_tp = tp_long[i] if pos_dir == LONG else tp_short[i]
+        entry_idx[k] = i
+        direction[k] = pos_dir
+        stop_loss[k] = pos_sl
+        take_profit[k] = pos_tp
+    
+    # Close any remaining position at the last bar
+    if pos_dir != FLAT:
+        exit_idx[k] = n - 1
+        exit_price[k] = closes[n - 1]
+        profit[k] = lot_value * (pos_dir * (closes[n - 1] - pos_entry) - commission_cost)
+        k += 1
+    
+    return (entry_idx[:k], exit_idx[:k], direction[:k], stop_loss[:k],
+            take_profit[:k], exit_price[:k], profit[:k])
+
+
+@njit(cache=True, parallel=True, nogil=True)
+def grid_backtest(highs, lows, closes, fast_grid, slow_grid, sl_long, tp_long,
+                  sl_short, tp_short, lot, commission, initial_balance):
+    """
+    Run run_ma_crossover_backtest for every (fast, slow) pair in parallel
+    
+    Args:
+        highs, lows, closes: Bar prices
+        fast_grid, slow_grid: Fast and slow MA periods, one entry per combination
+        sl_long, tp_long, sl_short, tp_short: Per-bar entry levels
+        lot: Lot size per trade
+        commission: Commission per side in price units
+        initial_balance: Starting balance of every run
+    
+    Returns:
+        tuple: Per-combination arrays (final_balance, sharpe, total_trades); the
+        Sharpe ratio is the mean over the standard deviation of trade profits
+    """
+    m = fast_grid.shape[0]
+    final_balance = np.empty(m, dtype=np.float64)
+    sharpe = np.zeros(m, dtype=np.float64)
+    total_trades = np.empty(m, dtype=np.int64)
+    
+    for j in prange(m):
+        profit = run_ma_crossover_backtest(
+            highs, lows, closes, fast_grid[j], slow_grid[j], sl_long, tp_long,
+            sl_short, tp_short, lot, commission
+        )[6]
+        final_balance[j] = initial_balance + profit.sum()
+        total_trades[j] = profit.shape[0]
+        if profit.shape[0] > 1:
+            std = profit.std()
+            if std > 0:
+                sharpe[j] = profit.mean() / std
+    
+    return final_balance, sharpe, total_trades
+
+
 class MACrossoverStrategy:
     """Simple Moving Average Crossover Strategy"""
     
@@ -207,51 +560,99 @@ class MACrossoverStrategy:
         """
         self.fast_period = fast_period
         self.slow_period = slow_period
-        self.position = None  # Current position direction
+        self.position = FLAT  # Current position direction
     
     def calculate_indicators(self, data):
-        """Calculate technical indicators"""
-        data['fast_ma'] = data['close'].rolling(window=self.fast_period).mean()
-        data['slow_ma'] = data['close'].rolling(window=self.slow_period).mean()
-        return data
+        """
+        Calculate technical indicators
+        
+        Returns:
+            tuple: (fast_ma, slow_ma) arrays aligned with data
+        """
+        closes = data['close'].to_numpy()
+        return _fast_sma(closes, self.fast_period), _fast_sma(closes, self.slow_period)
     
     def generate_signals(self, data):
         """Generate trading signals"""
-        data = self.calculate_indicators(data)
-        
-        signals = []
-        
-        for i in range(len(data)):
-            if i < self.slow_period:
-                signals.append(None)
-                continue
-            
-            current_fast = data['fast_ma'].iloc[i]
-            current_slow = data['slow_ma'].iloc[i]
-            prev_fast = data['fast_ma'].iloc[i-1]
-            prev_slow = data['slow_ma'].iloc[i-1]
-            
-            # Bullish crossover
-            if prev_fast <= prev_slow and current_fast > current_slow:
-                if self.position != 'long':
-                    signals.append('buy')
-                    self.position = 'long'
-                else:
-                    signals.append(None)
-            # Bearish crossover
-            elif prev_fast >= prev_slow and current_fast < current_slow:
-                if self.position != 'short':
-                    signals.append('sell')
-                    self.position = 'short'
-                else:
-                    signals.append(None)
-            else:
-                signals.append(None)
+        fast, slow = self.calculate_indicators(data)
+        n = len(data)
         
+        # Crossovers between the previous and the current bar
+        bullish = np.zeros(n, dtype=bool)
+        bearish = np.zeros(n, dtype=bool)
+        bullish[1:] = (fast[:-1] <= slow[:-1]) & (fast[1:] > slow[1:])
+        bearish[1:] = (fast[:-1] >= slow[:-1]) & (fast[1:] < slow[1:])
+        
+        crossovers = np.where(bullish, BUY, np.where(bearish, SELL, HOLD))
+        crossovers[:self.slow_period] = HOLD
+        
+        # Only emit a signal when the crossover changes the current position
+        # (BUY/SELL share their codes with LONG/SHORT)
+        crossover_idx = np.flatnonzero(crossovers)
+        events = crossovers[crossover_idx]
+        previous = np.empty_like(events)
+        if len(events):
+            previous[0] = self.position
+            previous[1:] = events[:-1]
+            self.position = LONG if events[-1] == BUY else SHORT
+        changed = events != previous
+        signals = np.zeros(n, dtype=np.int8)
+        signals[crossover_idx[changed]] = events[changed]
         data['signal'] = signals
         return data
 
 
+# ==================== EXPORT ====================
+
+def save_trades_csv(trades_df, path):
+    """
+    Write the trades DataFrame to CSV, using Polars' writer when available
+    
+    Args:
+        trades_df: Trades DataFrame from Backtest.get_trades_df()
+        path: Output file path
+    """
+    if pl is not None:
+        # Hand Polars the NumPy columns directly so no pyarrow round trip is needed
+        columns = {name: trades_df[name].to_numpy() for name in trades_df.columns}
+        pl.DataFrame(columns).write_csv(path, datetime_format='%Y-%m-%d %H:%M:%S')
+    else:
+        trades_df.to_csv(path, index=False)
+
+
+# ==================== CONFIGURATION ====================
+
+@dataclass(frozen=True)
+class MT5Credentials:
+    """MT5 account credentials, parsed once from the config file"""
+    login: int
+    password: str
+    server: str
+    path: str = ""
+    
+    @classmethod
+    def from_ini(cls, config_file='config.ini', section='MT5'):
+        """
+        Load credentials from an INI file section
+        
+        Args:
+            config_file: Path to the config file
+            section: Section holding login, password, server and optionally path
+        
+        Returns:
+            MT5Credentials: Parsed credentials
+        """
+        config = configparser.ConfigParser()
+        config.read(config_file)
+        values = config[section]
+        return cls(
+            login=int(values['login']),
+            password=values['password'],
+            server=values['server'],
+            path=values.get('path', ''),
+        )
+
+
 # ==================== RUN BACKTEST ====================
 
 def run_backtest():
@@ -272,15 +673,15 @@ def run_backtest():
     """)
     
     # Load configuration
-    config = configparser.ConfigParser()
-    config.read('config.ini')
+    credentials = MT5Credentials.from_ini('config.ini')
     
     # Initialize MT5 client
     client = MT5Client()
     client.initialize(
-        login=int(config['MT5']['login']),
-        password=config['MT5']['password'],
-        server=config['MT5']['server']
+        login=credentials.login,
+        password=credentials.password,
+        server=credentials.server,
+        path=credentials.path
     )
     
     if not client.is_connected():
@@ -291,7 +692,6 @@ def run_backtest():
     
     # Initialize data manager
     data_manager = MT5Data(client)
-    symbol_manager = MT5Symbol(client)
     
     # Get historical data
     symbol = 'EURUSD'
@@ -316,113 +716,82 @@ def run_backtest():
     
     print(f"✓ Retrieved {len(bars)} bars")
     
-    # Get symbol info for calculations
-    symbol_info = symbol_manager.get_info(symbol)
+    # Pull the raw columns out once; the simulation works on NumPy arrays
+    # only and pandas is used again just for the CSV export and the plot
+    times = bars.index.values
+    highs, lows, closes = (bars[k].to_numpy() for k in ('high', 'low', 'close'))
     
     # Initialize backtest
     backtest = Backtest(
         initial_balance=10000.0,
         risk_per_trade=0.01,
-        commission=0.0001
+        commission=0.0001,
+        capacity=len(closes)
     )
     
     # Initialize strategy
     strategy = MACrossoverStrategy(fast_period=20, slow_period=50)
     
-    # Generate signals
-    print("\nGenerating trading signals...")
-    bars = strategy.generate_signals(bars)
-    
-    # Run backtest
-    print("Running backtest...")
-    
-    current_position_idx = None
-    
-    for i in range(len(bars)):
-        row = bars.iloc[i]
-        
-        # Check stops for open positions
-        if current_position_idx is not None:
-            backtest.check_stops(row.name, row['high'], row['low'])
-            
-            # Check if position was closed
-            if not backtest.positions[current_position_idx]['open']:
-                current_position_idx = None
-        
-        # Process signals
-        signal = row['signal']
-        
-        if signal == 'buy':
-            # Close short if open
-            if current_position_idx is not None:
-                backtest.close_position(current_position_idx, row.name, row['close'])
-            
-            # Open long
-            stop_loss = row['close'] - 0.0050  # 50 pips SL
-            take_profit = row['close'] + 0.0100  # 100 pips TP
-            lot_size = 0.01  # Mini lot
-            
-            current_position_idx = backtest.open_position(
-                entry_time=row.name,
-                entry_price=row['close'],
-                direction='long',
-                stop_loss=stop_loss,
-                take_profit=take_profit,
-                lot_size=lot_size
-            )
-        
-        elif signal == 'sell':
-            # Close long if open
-            if current_position_idx is not None:
-                backtest.close_position(current_position_idx, row.name, row['close'])
-            
-            # Open short
-            stop_loss = row['close'] + 0.0050  # 50 pips SL
-            take_profit = row['close'] - 0.0100  # 100 pips TP
-            lot_size = 0.01  # Mini lot
-            
-            current_position_idx = backtest.open_position(
-                entry_time=row.name,
-                entry_price=row['close'],
-                direction='short',
-                stop_loss=stop_loss,
-                take_profit=take_profit,
-                lot_size=lot_size
-            )
-    
-    # Close any remaining positions
-    if current_position_idx is not None and backtest.positions[current_position_idx]['open']:
-        backtest.close_position(
-            current_position_idx,
-            bars.index[-1],
-            bars['close'].iloc[-1]
-        )
+    # Run backtest (indicators, signals and trade simulation in one pass)
+    print("\nRunning backtest...")
+    
+    lot_size = 0.01  # Mini lot
+    
+    # Entry levels for every bar: 50 pips SL / 100 pips TP
+    sl_long = closes - 0.0050
+    tp_long = closes + 0.0100
+    sl_short = closes + 0.0050
+    tp_short = closes - 0.0100
+    
+    (entry_idx, exit_idx, direction, stop_loss, take_profit,
+     exit_price, profit) = run_ma_crossover_backtest(
+        highs, lows, closes, strategy.fast_period, strategy.slow_period,
+        sl_long, tp_long, sl_short, tp_short, lot_size, backtest.commission
+    )
+    
+    backtest.record_trades(
+        times[entry_idx], closes[entry_idx], direction, stop_loss, take_profit,
+        lot_size, times[exit_idx], exit_price, profit
+    )
     
     # Print results
-    backtest.print_results()
+    results = backtest.get_results()
+    backtest.print_results(results)
+    
+    if not results['total_trades']:
+        print("\nNo trades were generated")
+        client.shutdown()
+        return
+    
+    # Parameter sweep over the same bars
+    print("\nRunning parameter sweep...")
+    sweep = backtest.grid_search(
+        MACrossoverStrategy,
+        {'fast_period': [5, 10, 15, 20, 30], 'slow_period': [40, 50, 100, 200]},
+        highs, lows, closes, sl_long, tp_long, sl_short, tp_short, lot_size
+    )
+    print(sweep.sort_values('final_balance', ascending=False).head().to_string(index=False))
     
     # Save trades to file
-    results = backtest.get_results()
-    if 'trades_df' in results:
-        trades_df = results['trades_df']
-        trades_df.to_csv('backtest_trades.csv', index=False)
-        print(f"\n✓ Trades saved to 'backtest_trades.csv'")
+    trades_df = results['trades_df']
+    save_trades_csv(trades_df, 'backtest_trades.csv')
+    print(f"\n✓ Trades saved to 'backtest_trades.csv'")
     
     # Plot equity curve (optional, requires matplotlib)
     try:
-        import matplotlib.pyplot as plt
-        
-        trades_df = results['trades_df']
-        
-        plt.figure(figsize=(12, 6))
-        plt.plot(trades_df.index, trades_df['balance'])
-        plt.axhline(y=backtest.initial_balance, color='r', linestyle='--', label='Initial Balance')
-        plt.title('Equity Curve')
-        plt.xlabel('Trade Number')
-        plt.ylabel('Balance ($)')
-        plt.legend()
-        plt.grid(True)
-        plt.savefig('equity_curve.png')
+        # A bare Figure renders through Agg, so no GUI backend is loaded
+        from matplotlib.figure import Figure
+        
+        fig = Figure(figsize=(12, 6))
+        ax = fig.add_subplot()
+        ax.plot(trades_df.index, trades_df['balance'])
+        ax.axhline(y=backtest.initial_balance, color='r', linestyle='--', label='Initial Balance')
+        ax.set_title('Equity Curve')
+        ax.set_xlabel('Trade Number')
+        ax.set_ylabel('Balance ($)')
+        ax.legend()
+        ax.grid(True)
+        fig.savefig('equity_curve.png')
         print("✓ Equity curve saved to 'equity_curve.png'")
         
     except ImportError:
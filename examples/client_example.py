@@ -3,76 +3,155 @@ MT5Client Usage Examples
 
 This module demonstrates various ways to use the MT5Client class
 for connecting to and managing MetaTrader 5 terminal connections.
+
+Install the package once with ``pip install -e .`` from the project root
+so ``mymt5`` is imported from site-packages; when it is not installed the
+project root is added to ``sys.path`` as a fallback.
 """
 
+import argparse
+import importlib.util
 import sys
 import os
-from pathlib import Path
+import traceback
+from functools import lru_cache
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-# Add project root to Python path to allow imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# Only fall back to the project root on sys.path when mymt5 is not installed
+if importlib.util.find_spec('mymt5') is None:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from mylogger import logger
 from mymt5.client import MT5Client
-import configparser
 
 
 logger.info("Loading client_example module")
 
+BANNER = "=" * 60
+HEADER = "\n" + BANNER
 
-def get_credentials_from_config(config_file='config.ini', section='MT5'):
+
+def _print_section(title):
+    """Print an example's title between banner lines."""
+    print(HEADER)
+    print(title)
+    print(BANNER)
+
+
+class Credentials:
     """
-    Load MT5 credentials from config file.
+    MT5 account credentials loaded from the config file.
 
-    Args:
-        config_file: Path to config file (default: 'config.ini')
-        section: Section name in config file (default: 'MT5')
+    Instances are cached and shared between callers, so treat them as read-only.
+    """
 
-    Returns:
-        dict: Dictionary with 'login', 'password', 'server', and optionally 'path'
-        None: If config file or section not found
+    __slots__ = ('login', 'password', 'server', 'path')
+
+    def __init__(self, login, password, server, path=None):
+        self.login = login
+        self.password = password
+        self.server = server
+        self.path = path
+
+    def __repr__(self):
+        return f"Credentials(login={self.login}, server='{self.server}')"
+
+
+def _open_config(config_file):
     """
-    config = configparser.ConfigParser()
+    Open a config file from the current dir, falling back to the project root.
 
-    # Resolve config file path - try current dir first, then project root
-    config_path = Path(config_file)
-    if not config_path.exists():
+    Raises:
+        FileNotFoundError: If the file exists in neither location
+    """
+    try:
+        return open(config_file, 'r', encoding='utf-8')
+    except FileNotFoundError:
         # Try in project root (parent of examples directory)
-        project_root = Path(__file__).parent.parent
-        config_path = project_root / config_file
+        return open(os.path.join(PROJECT_ROOT, config_file), 'r', encoding='utf-8')
 
-    # Check if config file exists
-    if not config_path.exists():
+
+def _parse_ini(lines, section):
+    """
+    Read one section of a simple INI file in a single pass over its lines.
+
+    Handles ``[section]`` headers, ``key = value`` lines and full-line
+    ``#``/``;`` comments, which is all the credentials file uses. Keys are
+    lower-cased like configparser does.
+
+    Returns:
+        dict: Key/value strings of the section
+        None: If the section is not present
+    """
+    current, values, found = None, {}, False
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] in '#;':
+            continue
+        if line[0] == '[' and line[-1] == ']':
+            current = line[1:-1].strip()
+            found = found or current == section
+            continue
+        if current == section and '=' in line:
+            key, _, value = line.partition('=')
+            values[key.strip().lower()] = value.strip()
+
+    return values if found else None
+
+
+@lru_cache(maxsize=16)
+def _load_credentials(config_file, section):
+    """Parse the credentials section of a config file (cached per file and section)."""
+    try:
+        f = _open_config(config_file)
+    except FileNotFoundError:
         logger.warning(f"Config file '{config_file}' not found")
         return None
 
-    config.read(str(config_path))
+    with f:
+        values = _parse_ini(f, section)
 
     # Check if section exists
-    if section not in config:
+    if values is None:
         logger.warning(f"Section '{section}' not found in config file")
         return None
 
-    # Extract credentials
-    credentials = {
-        'login': int(config[section].get('login', 0)),
-        'password': config[section].get('password', ''),
-        'server': config[section].get('server', ''),
-    }
+    # Extract credentials (path is optional)
+    return Credentials(
+        login=int(values.get('login', 0)),
+        password=values.get('password', ''),
+        server=values.get('server', ''),
+        path=values.get('path'),
+    )
+
+
+def get_credentials_from_config(config_file='config.ini', section='MT5'):
+    """
+    Load MT5 credentials from config file.
+
+    The file is located and parsed once per (config_file, section); later
+    calls return the cached result. Use clear_credentials_cache() to re-read.
+
+    Args:
+        config_file: Path to config file (default: 'config.ini')
+        section: Section name in config file (default: 'MT5')
+
+    Returns:
+        Credentials: login, password, server and path (None if not set)
+        None: If config file or section not found
+    """
+    return _load_credentials(config_file, section)
 
-    # Optional: Add path if specified
-    if 'path' in config[section]:
-        credentials['path'] = config[section]['path']
 
-    return credentials
+def clear_credentials_cache():
+    """Forget cached credentials so the next load re-reads the config file."""
+    _load_credentials.cache_clear()
 
 
 def example_basic_connection():
     """Example 1: Basic connection to MT5."""
-    print("\n" + "="*60)
-    print("Example 1: Basic Connection")
-    print("="*60)
+    _print_section("Example 1: Basic Connection")
 
     # Load credentials from config
     credentials = get_credentials_from_config()
@@ -85,9 +164,9 @@ def example_basic_connection():
 
     # Initialize and connect with credentials
     success = client.initialize(
-        login=credentials['login'],
-        password=credentials['password'],
-        server=credentials['server']
+        login=credentials.login,
+        password=credentials.password,
+        server=credentials.server
     )
 
     if success:
@@ -107,55 +186,39 @@ def example_basic_connection():
 
 def example_connection_from_config():
     """Example 2: Connect using configuration file."""
-    print("\n" + "="*60)
-    print("Example 2: Connection from Config File")
-    print("="*60)
+    _print_section("Example 2: Connection from Config File")
 
-    # Load credentials from config
+    # Load credentials (and the optional terminal path) from config; a
+    # missing file or [MT5] section both come back as None
     credentials = get_credentials_from_config()
     if not credentials:
         print("ERROR: Could not load credentials from config.ini")
         return
 
-    # Read config for additional settings
-    config = configparser.ConfigParser()
-    config_path = Path('config.ini')
-    if not config_path.exists():
-        project_root = Path(__file__).parent.parent
-        config_path = project_root / 'config.ini'
-    config.read(str(config_path))
-
-    if 'MT5' in config:
-
-        client = MT5Client(
-            path=credentials.get('path'),
-            timeout=30000
-        )
-
-        success = client.initialize(
-            login=credentials['login'],
-            password=credentials['password'],
-            server=credentials['server']
-        )
-
-        if success:
-            print("✓ Connected using config file!")
-            status = client.get_status()
-            print(f"  Terminal connected: {status['terminal_info']['connected']}")
-            print(f"  Account login: {status['account_info']['login']}")
-        else:
-            print("✗ Connection failed!")
+    client = MT5Client()
+
+    success = client.initialize(
+        login=credentials.login,
+        password=credentials.password,
+        server=credentials.server,
+        path=credentials.path,
+        timeout=30000
+    )
 
-        client.shutdown()
+    if success:
+        print("✓ Connected using config file!")
+        status = client.get_status()
+        print(f"  Terminal connected: {status['terminal_info']['connected']}")
+        print(f"  Account login: {status['account_info']['login']}")
     else:
-        print("✗ MT5 section not found in config.ini")
+        print("✗ Connection failed!")
+
+    client.shutdown()
 
 
 def example_context_manager():
     """Example 3: Using client as context manager."""
-    print("\n" + "="*60)
-    print("Example 3: Context Manager")
-    print("="*60)
+    _print_section("Example 3: Context Manager")
 
     # Load credentials from config
     credentials = get_credentials_from_config()
@@ -166,9 +229,9 @@ def example_context_manager():
     # Client automatically shuts down when exiting context
     with MT5Client() as client:
         if client.initialize(
-            login=credentials['login'],
-            password=credentials['password'],
-            server=credentials['server']
+            login=credentials.login,
+            password=credentials.password,
+            server=credentials.server
         ):
             print("✓ Connected within context manager")
             print(f"  Is connected: {client.is_connected()}")
@@ -181,9 +244,7 @@ def example_context_manager():
 
 def example_auto_reconnection():
     """Example 4: Auto-reconnection setup."""
-    print("\n" + "="*60)
-    print("Example 4: Auto-Reconnection")
-    print("="*60)
+    _print_section("Example 4: Auto-Reconnection")
 
     client = MT5Client()
 
@@ -205,9 +266,9 @@ def example_auto_reconnection():
 
     # Connect
     if client.initialize(
-        login=credentials['login'],
-        password=credentials['password'],
-        server=credentials['server']
+        login=credentials.login,
+        password=credentials.password,
+        server=credentials.server
     ):
         print("✓ Connected with auto-reconnect enabled")
 
@@ -220,9 +281,7 @@ def example_auto_reconnection():
 
 def example_event_callbacks():
     """Example 5: Using event callbacks."""
-    print("\n" + "="*60)
-    print("Example 5: Event Callbacks")
-    print("="*60)
+    _print_section("Example 5: Event Callbacks")
 
     def on_connect(**kwargs):
         """Called when client connects."""
@@ -253,9 +312,9 @@ def example_event_callbacks():
 
     # Events will be triggered automatically
     if client.initialize(
-        login=credentials['login'],
-        password=credentials['password'],
-        server=credentials['server']
+        login=credentials.login,
+        password=credentials.password,
+        server=credentials.server
     ):
         print("✓ Connection established (connect event should fire)")
 
@@ -265,27 +324,44 @@ def example_event_callbacks():
     client.shutdown()
 
 
-def example_multi_account():
-    """Example 6: Multi-account management."""
-    print("\n" + "="*60)
-    print("Example 6: Multi-Account Management")
-    print("="*60)
+def _client_with_demo_account(**client_options):
+    """
+    New client with the config.ini account saved as 'demo_account'.
 
-    client = MT5Client()
+    Shared setup for the multi-account and complete-workflow examples; each
+    example gets its own client and shuts it down, so settings or callbacks
+    one example adds never leak into the other.
 
-    # Load credentials from config
+    Args:
+        **client_options: Keyword arguments for MT5Client (e.g. timeout)
+
+    Returns:
+        MT5Client: Client with the saved account, or None if no credentials
+    """
     credentials = get_credentials_from_config()
     if not credentials:
-        print("ERROR: Could not load credentials from config.ini")
-        return
+        return None
 
-    # Save multiple accounts
+    client = MT5Client(**client_options)
     client.save_account(
         'demo_account',
-        credentials['login'],
-        credentials['password'],
-        credentials['server']
+        credentials.login,
+        credentials.password,
+        credentials.server,
+        credentials.path
     )
+    return client
+
+
+def example_multi_account():
+    """Example 6: Multi-account management."""
+    _print_section("Example 6: Multi-Account Management")
+
+    # Client with the config.ini account saved as 'demo_account'
+    client = _client_with_demo_account()
+    if client is None:
+        print("ERROR: Could not load credentials from config.ini")
+        return
 
     print("✓ Saved demo account")
 
@@ -306,9 +382,7 @@ def example_multi_account():
 
 def example_configuration():
     """Example 7: Configuration management."""
-    print("\n" + "="*60)
-    print("Example 7: Configuration Management")
-    print("="*60)
+    _print_section("Example 7: Configuration Management")
 
     client = MT5Client()
 
@@ -343,11 +417,7 @@ def example_configuration():
 
 def example_status_diagnostics():
     """Example 8: Status and diagnostics."""
-    print("\n" + "="*60)
-    print("Example 8: Status and Diagnostics")
-    print("="*60)
-
-    client = MT5Client()
+    _print_section("Example 8: Status and Diagnostics")
 
     # Load credentials from config
     credentials = get_credentials_from_config()
@@ -355,12 +425,14 @@ def example_status_diagnostics():
         print("ERROR: Could not load credentials from config.ini")
         return
 
+    client = MT5Client()
+
     if client.initialize(
-        login=credentials['login'],
-        password=credentials['password'],
-        server=credentials['server']
+        login=credentials.login,
+        password=credentials.password,
+        server=credentials.server
     ):
-        # Get comprehensive status
+        # Get comprehensive status once and read everything from it
         status = client.get_status()
 
         print("✓ Client Status:")
@@ -369,8 +441,8 @@ def example_status_diagnostics():
         print(f"  Account: {status['account_info']['login']}")
         print(f"  Server: {status['account_info']['server']}")
 
-        # Get connection statistics
-        stats = client.get_connection_statistics()
+        # Connection statistics are part of the status snapshot
+        stats = status['statistics']
 
         print("\n✓ Connection Statistics:")
         print(f"  Total attempts: {stats['total_attempts']}")
@@ -387,9 +459,7 @@ def example_status_diagnostics():
 
 def example_error_handling():
     """Example 9: Error handling."""
-    print("\n" + "="*60)
-    print("Example 9: Error Handling")
-    print("="*60)
+    _print_section("Example 9: Error Handling")
 
     client = MT5Client()
 
@@ -419,12 +489,13 @@ def example_error_handling():
 
 def example_complete_workflow():
     """Example 10: Complete workflow."""
-    print("\n" + "="*60)
-    print("Example 10: Complete Workflow")
-    print("="*60)
+    _print_section("Example 10: Complete Workflow")
 
-    # 1. Create client with configuration
-    client = MT5Client(timeout=30000)
+    # 1. Create a client with configuration and the saved demo account
+    client = _client_with_demo_account(timeout=30000)
+    if client is None:
+        print("ERROR: Could not load credentials from config.ini")
+        return
 
     # 2. Enable auto-reconnection
     client.enable_auto_reconnect(retry_attempts=3, retry_delay=5)
@@ -440,76 +511,90 @@ def example_complete_workflow():
     client.on('connect', on_connect)
     client.on('error', on_error)
 
-    # 4. Load credentials from config
-    credentials = get_credentials_from_config()
-    if not credentials:
-        print("ERROR: Could not load credentials from config.ini")
-        return
-
-    # Save account credentials
-    client.save_account(
-        'my_demo',
-        credentials['login'],
-        credentials['password'],
-        credentials['server']
-    )
-
-    # 5. Connect using saved account
+    # 4. Connect using the saved account
     print("\n1. Connecting...")
-    if client.switch_account('my_demo'):
-        # 6. Check status
+    if client.switch_account('demo_account'):
+        # 5. Check status
         print("\n2. Checking status...")
         status = client.get_status()
         print(f"   Connected: {status['is_connected']}")
         print(f"   Account: {status['account_info']['login']}")
 
-        # 7. Get statistics
+        # 6. Get statistics (already included in the status snapshot)
         print("\n3. Getting statistics...")
-        stats = client.get_connection_statistics()
+        stats = status['statistics']
         print(f"   Success rate: {stats['success_rate']:.1%}")
 
-        # 8. Export logs
+        # 7. Export logs
         print("\n4. Exporting logs...")
         client.export_logs('examples/complete_workflow_logs.json')
         print("   ✓ Logs exported")
 
-        # 9. Save configuration
+        # 8. Save configuration
         print("\n5. Saving configuration...")
         client.save_config('examples/complete_workflow_config.json')
         print("   ✓ Configuration saved")
 
-    # 10. Cleanup
-    print("\n6. Shutting down...")
     client.shutdown()
-    print("   ✓ Client shutdown complete")
 
 
-def main():
-    """Run all examples."""
-    print("\n" + "="*60)
-    print("MT5Client Usage Examples")
-    print("="*60)
+# Examples by name, in the order main() runs them by default
+EXAMPLES = {
+    'basic': example_basic_connection,
+    'config': example_connection_from_config,
+    'context': example_context_manager,
+    'reconnect': example_auto_reconnection,
+    'events': example_event_callbacks,
+    'accounts': example_multi_account,
+    'configuration': example_configuration,
+    'status': example_status_diagnostics,
+    'errors': example_error_handling,
+    'workflow': example_complete_workflow,
+}
 
-    try:
-        example_basic_connection()
-        example_connection_from_config()
-        example_context_manager()
-        example_auto_reconnection()
-        example_event_callbacks()
-        example_multi_account()
-        example_configuration()
-        example_status_diagnostics()
-        example_error_handling()
-        example_complete_workflow()
-
-        print("\n" + "="*60)
-        print("All examples completed!")
-        print("="*60 + "\n")
 
-    except Exception as e:
-        print(f"\n❌ Error running examples: {e}")
-        import traceback
-        traceback.print_exc()
+def main(argv=None):
+    """
+    Run the examples.
+
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:]); example
+            names select which examples to run, -x stops at the first error
+    """
+    parser = argparse.ArgumentParser(description="MT5Client usage examples")
+    parser.add_argument('names', nargs='*', metavar='name',
+                        help=f"examples to run: {', '.join(EXAMPLES)} (default: all)")
+    parser.add_argument('-x', '--exitfirst', action='store_true',
+                        help="stop after the first example that raises")
+    args = parser.parse_args(argv)
+
+    unknown = [name for name in args.names if name not in EXAMPLES]
+    if unknown:
+        parser.error(f"unknown example(s): {', '.join(unknown)}")
+
+    _print_section("MT5Client Usage Examples")
+
+    # The examples run one after another on purpose: the MetaTrader5 package
+    # keeps a single terminal connection per process, so running them
+    # concurrently would have each example's shutdown() or login drop the
+    # connection another example is using.
+    failed = []
+    for name in args.names or EXAMPLES:
+        try:
+            EXAMPLES[name]()
+        except Exception as e:
+            failed.append(name)
+            print(f"\n❌ Error running example '{name}': {e}")
+            traceback.print_exc()
+            if args.exitfirst:
+                break
+
+    print(HEADER)
+    if failed:
+        print(f"Examples with errors: {', '.join(failed)}")
+    else:
+        print("All examples completed!")
+    print(BANNER + "\n")
 
 
 if __name__ == "__main__":
@@ -24,20 +24,59 @@ from mymt5.__version__ import (
     __copyright__,
 )
 
-# Core imports
-from mymt5.client import MT5Client
-from mymt5.account import MT5Account
-from mymt5.symbol import MT5Symbol
-from mymt5.terminal import MT5Terminal
-from mymt5.data import MT5Data
-from mymt5.history import MT5History
-from mymt5.trade import MT5Trade
-from mymt5.risk import MT5Risk
-from mymt5.validator import MT5Validator
-from mymt5.utils import MT5Utils
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Static imports for type checkers and IDEs; at runtime these names are
+    # resolved lazily by __getattr__ below
+    from mymt5.client import MT5Client
+    from mymt5.account import MT5Account
+    from mymt5.symbol import MT5Symbol
+    from mymt5.terminal import MT5Terminal
+    from mymt5.data import MT5Data
+    from mymt5.history import MT5History
+    from mymt5.trade import MT5Trade
+    from mymt5.risk import MT5Risk
+    from mymt5.validator import MT5Validator
+    from mymt5.utils import MT5Utils
+    from mymt5.enums import ConnectionState, OrderType, TimeFrame
+
+# Public classes and enums, imported lazily on first access (PEP 562) so that
+# `import mymt5` does not load every submodule and its dependencies
+_LAZY_IMPORTS = {
+    # Core classes
+    'MT5Client': 'mymt5.client',
+    'MT5Account': 'mymt5.account',
+    'MT5Symbol': 'mymt5.symbol',
+    'MT5Terminal': 'mymt5.terminal',
+    'MT5Data': 'mymt5.data',
+    'MT5History': 'mymt5.history',
+    'MT5Trade': 'mymt5.trade',
+    'MT5Risk': 'mymt5.risk',
+    'MT5Validator': 'mymt5.validator',
+    'MT5Utils': 'mymt5.utils',
+
+    # Enums
+    'ConnectionState': 'mymt5.enums',
+    'OrderType': 'mymt5.enums',
+    'TimeFrame': 'mymt5.enums',
+}
+
+
+def __getattr__(name):
+    """Import a public class from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# Enums
-from mymt5.enums import ConnectionState, OrderType, TimeFrame
 
 __all__ = [
     # Version info
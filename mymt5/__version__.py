@@ -1,7 +1,8 @@
 """Version information for MyMT5 package."""
 
+# Keep __version__ and __version_info__ in sync when bumping the version
 __version__ = '1.0.0'
-__version_info__ = tuple(int(i) for i in __version__.split('.'))
+__version_info__ = (1, 0, 0)
 
 __title__ = 'mymt5'
 __description__ = 'Comprehensive Python library for MetaTrader 5 trading'
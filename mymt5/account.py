@@ -1,9 +1,100 @@
 """MT5Account - Account information and management"""
 
 from mylogger import logger
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Callable, Mapping, Union
 import MetaTrader5 as mt5
+import numpy as np
+import operator
+import time
 from datetime import datetime, timedelta
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
+
+# Fields copied from mt5.account_info(), in MT5's order
+_ACCOUNT_FIELDS = (
+    'login', 'trade_mode', 'leverage', 'limit_orders', 'margin_so_mode',
+    'trade_allowed', 'trade_expert', 'margin_mode', 'currency_digits',
+    'fifo_close', 'balance', 'credit', 'profit', 'equity', 'margin',
+    'margin_free', 'margin_level', 'margin_so_call', 'margin_so_so',
+    'margin_initial', 'margin_maintenance', 'assets', 'liabilities',
+    'commission_blocked', 'name', 'server', 'currency', 'company',
+)
+_ACCOUNT_GETTER = operator.attrgetter(*_ACCOUNT_FIELDS)
+# JSON-native type of each field, so exports need no fallback serializer
+_ACCOUNT_TYPES = (
+    (int,) * 5 + (bool, bool, int, int, bool)  # login .. fifo_close
+    + (float,) * 14  # balance .. commission_blocked
+    + (str,) * 4  # name .. company
+)
+
+# Keys of calculate('health'), in order
+_HEALTH_KEYS = (
+    'balance', 'equity', 'profit', 'margin', 'margin_free',
+    'margin_level', 'drawdown_percent', 'health_status',
+)
+
+
+def _first_positive(*prices):
+    """Return the first price that is set and greater than 0, or None."""
+    for price in prices:
+        if price and price > 0:
+            return price
+    return None
+
+
+# Price sources for _calculate_margin_required, each returning a price > 0 or None
+
+def _price_from_quote(symbol_info):
+    """Current ask, then bid, from symbol_info."""
+    return _first_positive(getattr(symbol_info, 'ask', 0), getattr(symbol_info, 'bid', 0))
+
+
+def _price_from_tick(symbol: str):
+    """Ask, bid, then last of the current tick."""
+    tick = mt5.symbol_info_tick(symbol)
+    if tick is None:
+        return None
+    return _first_positive(
+        getattr(tick, 'ask', 0), getattr(tick, 'bid', 0), getattr(tick, 'last', 0)
+    )
+
+
+def _price_from_last(symbol_info):
+    """Last deal price from symbol_info."""
+    return _first_positive(getattr(symbol_info, 'last', 0))
+
+
+def _price_from_recent_ticks(symbol: str):
+    """Last tick within the past day with a usable price, preferring ask -> bid -> last."""
+    since = datetime.now() - timedelta(days=1)
+    ticks = mt5.copy_ticks_from(symbol, since, 1000, mt5.COPY_TICKS_INFO)
+    if ticks is None or len(ticks) == 0:
+        return None
+    names = ticks.dtype.names
+    fields = [ticks[name] for name in ('ask', 'bid', 'last') if name in names]
+    valid = [field > 0 for field in fields]
+    rows = np.flatnonzero(np.logical_or.reduce(valid)) if valid else ()
+    if not len(rows):
+        return None
+    row = rows[-1]
+    for field, ok in zip(fields, valid):
+        if ok[row]:
+            return float(field[row])
+    return None
+
+
+def _price_from_m1_close(symbol: str):
+    """Close of the latest M1 candle."""
+    rates = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M1, 0, 1)
+    if rates is None or len(rates) == 0 or 'close' not in rates.dtype.names:
+        return None
+    close_v = rates[0]['close']
+    return float(close_v) if close_v and close_v > 0 else None
 
 
 class MT5Account:
@@ -14,6 +105,34 @@ class MT5Account:
     calculate account metrics, and export account data.
     """
 
+    # check() status types -> predicate on the account info dict
+    _STATUS_CHECKS: Dict[str, Callable[[Mapping[str, Any]], bool]] = {
+        # trade_mode: 0 - demo, 1 - contest, 2 - real
+        'demo': lambda info: info['trade_mode'] == 0,
+        # If we can fetch account info, we're authorized
+        'authorized': lambda info: True,
+        'trade_allowed': operator.itemgetter('trade_allowed'),
+        'expert_allowed': operator.itemgetter('trade_expert'),
+    }
+    _INVALID_STATUS_MSG = f"Invalid status_type. Must be one of {list(_STATUS_CHECKS)}"
+
+    # calculate() metrics -> method name
+    # calculate() metrics -> (method name, whether caller kwargs are forwarded)
+    _CALCULATORS = {
+        'margin_level': ('_calculate_margin_level', False),
+        'drawdown': ('_calculate_drawdown', True),
+        'health': ('_calculate_health_metrics', False),
+        'margin_required': ('_calculate_margin_required', True),
+    }
+    _INVALID_METRIC_MSG = f"Invalid metric. Must be one of {list(_CALCULATORS)}"
+
+    # export() formats -> method name
+    _EXPORTERS = {
+        'dict': '_export_dict',
+        'json': '_export_json',
+        'csv': '_export_csv',
+    }
+
     def __init__(self, client):
         """
         Initialize MT5Account with a client instance.
@@ -24,7 +143,7 @@ class MT5Account:
         logger.info("Initializing MT5Account")
         self.client = client
         self._account_info_cache = None
-        self._cache_timestamp = None
+        self._cache_timestamp: Optional[float] = None  # time.monotonic() of the last fetch
         self._cache_duration = 1  # seconds
 
     def get(self, attribute: Optional[str] = None) -> Union[Any, Dict[str, Any]]:
@@ -36,7 +155,7 @@ class MT5Account:
                       If None, returns all account information as dict
 
         Returns:
-            Requested attribute value or complete account info dict
+            Requested attribute value or dictionary of all account info
 
         Raises:
             ValueError: If attribute doesn't exist
@@ -50,83 +169,59 @@ class MT5Account:
             >>> account.get()  # Returns all info
             {'balance': 10000.0, 'equity': 10500.0, ...}
         """
-        logger.info(f"Getting account info: attribute={attribute}")
+        logger.info("Getting account info: attribute={}", attribute)
 
         account_info = self._fetch_account_info()
 
         if attribute is None:
-            return account_info
-
-        if attribute not in account_info:
-            logger.error(f"Invalid attribute: {attribute}")
-            raise ValueError(f"Attribute '{attribute}' does not exist")
+            # A plain dict copy; the cached read-only view stays internal
+            return dict(account_info)
 
-        return account_info[attribute]
+        try:
+            return account_info[attribute]
+        except KeyError:
+            logger.error("Invalid attribute: {}", attribute)
+            raise ValueError(f"Attribute '{attribute}' does not exist") from None
 
-    def _fetch_account_info(self) -> Dict[str, Any]:
+    def _fetch_account_info(self) -> Mapping[str, Any]:
         """
         Private method to fetch account information from MT5.
         Implements caching to reduce API calls.
 
         Returns:
-            Dictionary with account information
+            Read-only mapping with account information
 
         Raises:
             RuntimeError: If failed to retrieve account info
         """
         # Check cache
-        if self._account_info_cache is not None and self._cache_timestamp is not None:
-            elapsed = (datetime.now() - self._cache_timestamp).total_seconds()
-            if elapsed < self._cache_duration:
-                logger.debug("Returning cached account info")
-                return self._account_info_cache
+        cached = self._account_info_cache
+        fetched_at = self._cache_timestamp
+        if (cached is not None and fetched_at is not None
+                and time.monotonic() - fetched_at < self._cache_duration):
+            logger.debug("Returning cached account info")
+            return cached
 
         logger.debug("Fetching fresh account info from MT5")
         account_info = mt5.account_info()
 
         if account_info is None:
             error_code, error_desc = mt5.last_error()
-            logger.error(f"Failed to get account info: {error_code} - {error_desc}")
+            logger.error("Failed to get account info: {} - {}", error_code, error_desc)
             raise RuntimeError(f"Failed to get account info: {error_code} - {error_desc}")
 
         # Convert to dictionary
-        info_dict = {
-            'login': account_info.login,
-            'trade_mode': account_info.trade_mode,
-            'leverage': account_info.leverage,
-            'limit_orders': account_info.limit_orders,
-            'margin_so_mode': account_info.margin_so_mode,
-            'trade_allowed': account_info.trade_allowed,
-            'trade_expert': account_info.trade_expert,
-            'margin_mode': account_info.margin_mode,
-            'currency_digits': account_info.currency_digits,
-            'fifo_close': account_info.fifo_close,
-            'balance': account_info.balance,
-            'credit': account_info.credit,
-            'profit': account_info.profit,
-            'equity': account_info.equity,
-            'margin': account_info.margin,
-            'margin_free': account_info.margin_free,
-            'margin_level': account_info.margin_level,
-            'margin_so_call': account_info.margin_so_call,
-            'margin_so_so': account_info.margin_so_so,
-            'margin_initial': account_info.margin_initial,
-            'margin_maintenance': account_info.margin_maintenance,
-            'assets': account_info.assets,
-            'liabilities': account_info.liabilities,
-            'commission_blocked': account_info.commission_blocked,
-            'name': account_info.name,
-            'server': account_info.server,
-            'currency': account_info.currency,
-            'company': account_info.company,
-        }
+        info_dict = dict(zip(_ACCOUNT_FIELDS, [
+            convert(value) for convert, value in zip(_ACCOUNT_TYPES, _ACCOUNT_GETTER(account_info))
+        ]))
 
-        # Update cache
-        self._account_info_cache = info_dict
-        self._cache_timestamp = datetime.now()
+        # Update cache, wrapped once so every reader shares the same read-only view
+        account_view = MappingProxyType(info_dict)
+        self._account_info_cache = account_view
+        self._cache_timestamp = time.monotonic()
 
         logger.info("Account info retrieved successfully")
-        return info_dict
+        return account_view
 
     def check(self, status_type: str) -> bool:
         """
@@ -151,27 +246,16 @@ class MT5Account:
             >>> account.check('trade_allowed')
             True
         """
-        logger.info(f"Checking account status: {status_type}")
+        logger.info("Checking account status: {}", status_type)
 
-        valid_types = ['demo', 'authorized', 'trade_allowed', 'expert_allowed']
-        if status_type not in valid_types:
-            logger.error(f"Invalid status_type: {status_type}")
-            raise ValueError(f"Invalid status_type. Must be one of {valid_types}")
+        status_check = self._STATUS_CHECKS.get(status_type)
+        if status_check is None:
+            logger.error("Invalid status_type: {}", status_type)
+            raise ValueError(self._INVALID_STATUS_MSG)
 
-        account_info = self._fetch_account_info()
+        result = status_check(self._fetch_account_info())
 
-        if status_type == 'demo':
-            # trade_mode: 0 - demo, 1 - contest, 2 - real
-            result = account_info['trade_mode'] == 0
-        elif status_type == 'authorized':
-            # If we can fetch account info, we're authorized
-            result = True
-        elif status_type == 'trade_allowed':
-            result = account_info['trade_allowed']
-        elif status_type == 'expert_allowed':
-            result = account_info['trade_expert']
-
-        logger.info(f"Status check {status_type}: {result}")
+        logger.info("Status check {}: {}", status_type, result)
         return result
 
     def calculate(self, metric: str, **kwargs) -> Union[float, Dict[str, Any]]:
@@ -197,31 +281,33 @@ class MT5Account:
             >>> account.calculate('margin_required', symbol='EURUSD', volume=1.0)
             1000.0
         """
-        logger.info(f"Calculating metric: {metric}")
-
-        valid_metrics = ['margin_level', 'drawdown', 'health', 'margin_required']
-        if metric not in valid_metrics:
-            logger.error(f"Invalid metric: {metric}")
-            raise ValueError(f"Invalid metric. Must be one of {valid_metrics}")
-
-        if metric == 'margin_level':
-            return self._calculate_margin_level()
-        elif metric == 'drawdown':
-            return self._calculate_drawdown(**kwargs)
-        elif metric == 'health':
-            return self._calculate_health_metrics()
-        elif metric == 'margin_required':
-            return self._calculate_margin_required(**kwargs)
-
-    def _calculate_margin_level(self) -> float:
+        logger.info("Calculating metric: {}", metric)
+
+        calculator = self._CALCULATORS.get(metric)
+        if calculator is None:
+            logger.error("Invalid metric: {}", metric)
+            raise ValueError(self._INVALID_METRIC_MSG)
+
+        # 'info' is internal (pre-fetched account data), not a public parameter
+        if 'info' in kwargs:
+            raise TypeError("calculate() got an unexpected keyword argument 'info'")
+
+        method_name, forwards_kwargs = calculator
+        method = getattr(self, method_name)
+        return method(**kwargs) if forwards_kwargs else method()
+
+    def _calculate_margin_level(self, info: Optional[Mapping[str, Any]] = None) -> float:
         """
         Calculate current margin level.
 
+        Args:
+            info: Account info already fetched by the caller (fetched if None)
+
         Returns:
             Margin level as percentage (equity/margin * 100)
             Returns 0 if margin is 0
         """
-        account_info = self._fetch_account_info()
+        account_info = self._fetch_account_info() if info is None else info
         margin = account_info['margin']
 
         if margin == 0:
@@ -237,20 +323,22 @@ class MT5Account:
             return 0.0
 
         margin_level = (account_info['equity'] / margin) * 100
-        logger.info(f"Calculated margin level: {margin_level:.2f}%")
+        logger.info("Calculated margin level: {:.2f}%", margin_level)
         return margin_level
 
-    def _calculate_drawdown(self, type: str = 'percent') -> float:
+    def _calculate_drawdown(self, type: str = 'percent',
+                            info: Optional[Mapping[str, Any]] = None) -> float:
         """
         Calculate current drawdown.
 
         Args:
             type: 'percent' or 'absolute'
+            info: Account info already fetched by the caller (fetched if None)
 
         Returns:
             Drawdown value
         """
-        account_info = self._fetch_account_info()
+        account_info = self._fetch_account_info() if info is None else info
         balance = account_info['balance']
         equity = account_info['equity']
 
@@ -262,7 +350,7 @@ class MT5Account:
             else:
                 drawdown = ((balance - equity) / balance) * 100
 
-        logger.info(f"Calculated drawdown ({type}): {drawdown:.2f}")
+        logger.info("Calculated drawdown ({}): {:.2f}", type, drawdown)
         return drawdown
 
     def _calculate_health_metrics(self) -> Dict[str, Any]:
@@ -281,32 +369,37 @@ class MT5Account:
         profit = account_info['profit']
 
         # Calculate metrics (handles 0-margin internally, may return inf)
-        margin_level = self._calculate_margin_level()
-        drawdown_percent = self._calculate_drawdown(type='percent')
+        margin_level = self._calculate_margin_level(account_info)
+        drawdown_percent = self._calculate_drawdown(type='percent', info=account_info)
 
-        # Determine health status
+        health_status = self._classify_health(margin_level)
+
+        health_metrics = dict(zip(_HEALTH_KEYS, (
+            balance, equity, profit, margin, margin_free,
+            margin_level, drawdown_percent, health_status,
+        )))
+
+        logger.info("Health metrics calculated: status={}", health_status)
+        return health_metrics
+
+    @staticmethod
+    def _classify_health(margin_level: float) -> str:
+        """
+        Map a margin level to a health status.
+
+        Args:
+            margin_level: Margin level percentage
+
+        Returns:
+            'excellent', 'good', 'warning' or 'critical'
+        """
         if margin_level > 200:
-            health_status = 'excellent'
+            return 'excellent'
         elif margin_level > 100:
-            health_status = 'good'
+            return 'good'
         elif margin_level > 50:
-            health_status = 'warning'
-        else:
-            health_status = 'critical'
-
-        health_metrics = {
-            'balance': balance,
-            'equity': equity,
-            'profit': profit,
-            'margin': margin,
-            'margin_free': margin_free,
-            'margin_level': margin_level,
-            'drawdown_percent': drawdown_percent,
-            'health_status': health_status,
-        }
-
-        logger.info(f"Health metrics calculated: status={health_status}")
-        return health_metrics
+            return 'warning'
+        return 'critical'
 
     def _calculate_margin_required(self, symbol: str, volume: float, **kwargs) -> float:
         """
@@ -322,80 +415,42 @@ class MT5Account:
         Raises:
             RuntimeError: If calculation fails
         """
-        logger.info(f"Calculating margin required for {symbol}, volume={volume}")
+        logger.info("Calculating margin required for {}, volume={}", symbol, volume)
 
         # Ensure symbol is selected/visible in Market Watch
         try:
             if not mt5.symbol_select(symbol, True):
-                logger.warning(f"Symbol {symbol} was not selected; attempting to select failed")
+                logger.warning("Symbol {} was not selected; attempting to select failed", symbol)
         except Exception as e:
-            logger.warning(f"Exception while selecting symbol {symbol}: {e}")
+            logger.warning("Exception while selecting symbol {}: {}", symbol, e)
 
         # Get symbol info for pricing
         symbol_info = mt5.symbol_info(symbol)
         if symbol_info is None:
             code, desc = mt5.last_error()
-            logger.error(f"Failed to get symbol info for {symbol}: {code} - {desc}")
+            logger.error("Failed to get symbol info for {}: {} - {}", symbol, code, desc)
             raise RuntimeError(f"Failed to get symbol info for {symbol}: {code} - {desc}")
 
-        # Determine a robust price to use: ask -> bid -> tick -> last
-        price = None
-        try:
-            if getattr(symbol_info, 'ask', 0) and symbol_info.ask > 0:
-                price = symbol_info.ask
-            elif getattr(symbol_info, 'bid', 0) and symbol_info.bid > 0:
-                price = symbol_info.bid
-            else:
-                tick = mt5.symbol_info_tick(symbol)
-                if tick is not None:
-                    if getattr(tick, 'ask', 0) and tick.ask > 0:
-                        price = tick.ask
-                    elif getattr(tick, 'bid', 0) and tick.bid > 0:
-                        price = tick.bid
-                    elif getattr(tick, 'last', 0) and tick.last > 0:
-                        price = tick.last
-            if price is None and getattr(symbol_info, 'last', 0) and symbol_info.last > 0:
-                price = symbol_info.last
-        except Exception as e:
-            logger.warning(f"Exception while selecting price for {symbol}: {e}")
-
-        if price is None or price <= 0:
-            # Fallback 1: try recent ticks within last day
+        # Try each price source in turn: symbol ask/bid -> tick -> symbol last
+        # -> recent ticks -> last M1 close. The first usable price wins.
+        price_sources = (
+            ('selecting price', _price_from_quote, symbol_info),
+            ('selecting price', _price_from_tick, symbol),
+            ('selecting price', _price_from_last, symbol_info),
+            ('fetching recent ticks', _price_from_recent_ticks, symbol),
+            ('fetching M1 close', _price_from_m1_close, symbol),
+        )
+        for action, source, arg in price_sources:
             try:
-                since = datetime.now() - timedelta(days=1)
-                ticks = mt5.copy_ticks_from(symbol, since, 1000, mt5.COPY_TICKS_INFO)
-                if ticks is not None and len(ticks) > 0:
-                    # Find the last tick with usable price
-                    for t in reversed(ticks):
-                        ask_v = t['ask'] if 'ask' in t.dtype.names else 0
-                        bid_v = t['bid'] if 'bid' in t.dtype.names else 0
-                        last_v = t['last'] if 'last' in t.dtype.names else 0
-                        if ask_v and ask_v > 0:
-                            price = float(ask_v)
-                            break
-                        if bid_v and bid_v > 0:
-                            price = float(bid_v)
-                            break
-                        if last_v and last_v > 0:
-                            price = float(last_v)
-                            break
+                price = source(arg)
             except Exception as e:
-                logger.warning(f"Exception while fetching recent ticks for {symbol}: {e}")
-
-        if price is None or price <= 0:
-            # Fallback 2: try last M1 candle close
-            try:
-                rates = mt5.copy_rates_from_pos(symbol, mt5.TIMEFRAME_M1, 0, 1)
-                if rates is not None and len(rates) > 0 and 'close' in rates.dtype.names:
-                    close_v = rates[0]['close']
-                    if close_v and close_v > 0:
-                        price = float(close_v)
-            except Exception as e:
-                logger.warning(f"Exception while fetching M1 close for {symbol}: {e}")
-
-        if price is None or price <= 0:
+                logger.warning("Exception while {} for {}: {}", action, symbol, e)
+                continue
+            if price is not None:
+                break
+        else:
             code, desc = mt5.last_error()
-            logger.error(f"No valid price available for {symbol}; last_error={code} - {desc}")
+            logger.error("No valid price available for {}; last_error={} - {}", symbol, code, desc)
             raise RuntimeError(f"No valid price available for {symbol}")
 
         # Calculate margin using MT5 function
@@ -403,10 +458,12 @@ class MT5Account:
         margin = mt5.order_calc_margin(action, symbol, volume, price)
         if margin is None:
             code, desc = mt5.last_error()
-            logger.error(f"Failed to calculate margin for {symbol} at price {price}: {code} - {desc}")
+            logger.error(
+                "Failed to calculate margin for {} at price {}: {} - {}", symbol, price, code, desc
+            )
             raise RuntimeError(f"Failed to calculate margin: {code} - {desc}")
 
-        logger.info(f"Required margin: {margin}")
+        logger.info("Required margin: {}", margin)
         return margin
 
     def validate_credentials(self, login: int, password: str, server: str) -> bool:
@@ -421,7 +478,7 @@ class MT5Account:
         Returns:
             True if credentials are valid, False otherwise
         """
-        logger.info(f"Validating credentials for login={login}, server={server}")
+        logger.info("Validating credentials for login={}, server={}", login, server)
 
         try:
             # Try to authorize with provided credentials
@@ -434,7 +491,7 @@ class MT5Account:
                 logger.warning("Invalid credentials")
                 return False
         except Exception as e:
-            logger.error(f"Error validating credentials: {e}")
+            logger.error("Error validating credentials: {}", e)
             return False
 
     def get_summary(self) -> Dict[str, Any]:
@@ -447,7 +504,8 @@ class MT5Account:
         logger.info("Getting account summary")
 
         account_info = self._fetch_account_info()
-        health = self._calculate_health_metrics()
+        # Only the margin level is needed here, not the full health metrics
+        margin_level = self._calculate_margin_level(account_info)
 
         summary = {
             'login': account_info['login'],
@@ -460,11 +518,11 @@ class MT5Account:
             'profit': account_info['profit'],
             'margin': account_info['margin'],
             'margin_free': account_info['margin_free'],
-            'margin_level': health['margin_level'],
+            'margin_level': margin_level,
             'leverage': account_info['leverage'],
             'trade_mode': 'Demo' if account_info['trade_mode'] == 0 else 'Real',
             'trade_allowed': account_info['trade_allowed'],
-            'health_status': health['health_status'],
+            'health_status': self._classify_health(margin_level),
         }
 
         logger.info("Account summary generated")
@@ -487,39 +545,49 @@ class MT5Account:
             >>> account.export('json', 'account_info.json')
             'Exported to account_info.json'
         """
-        logger.info(f"Exporting account info: format={format}")
+        logger.info("Exporting account info: format={}", format)
 
-        account_info = self._fetch_account_info()
+        method_name = self._EXPORTERS.get(format)
+        if method_name is None:
+            logger.error("Invalid export format: {}", format)
+            raise ValueError(f"Invalid format. Must be 'dict', 'json', or 'csv'")
+
+        return getattr(self, method_name)(self._fetch_account_info(), filepath)
 
-        if format == 'dict':
-            return account_info
-        elif format == 'json':
+    def _export_dict(self, account_info: Mapping[str, Any], filepath: Optional[str]) -> Dict:
+        """Return a copy of the account info, so the cache stays private."""
+        return dict(account_info)
+
+    def _export_json(self, account_info: Mapping[str, Any], filepath: Optional[str]) -> str:
+        """Serialize the account info to JSON, optionally writing it to filepath."""
+        if orjson is not None:
+            payload = orjson.dumps(dict(account_info), option=orjson.OPT_INDENT_2)
+        else:
             import json
-            json_str = json.dumps(account_info, indent=2, default=str)
-
-            if filepath:
-                with open(filepath, 'w') as f:
-                    f.write(json_str)
-                logger.info(f"Account info exported to {filepath}")
-                return f"Exported to {filepath}"
-            return json_str
-        elif format == 'csv':
-            import csv
-
-            if not filepath:
-                filepath = 'account_info.csv'
-
-            with open(filepath, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Field', 'Value'])
-                for key, value in account_info.items():
-                    writer.writerow([key, value])
-
-            logger.info(f"Account info exported to {filepath}")
+            payload = json.dumps(dict(account_info), indent=2).encode('utf-8')
+
+        if filepath:
+            # Written as UTF-8 bytes so non-ASCII names don't depend on the locale encoding
+            with open(filepath, 'wb') as f:
+                f.write(payload)
+            logger.info("Account info exported to {}", filepath)
             return f"Exported to {filepath}"
-        else:
-            logger.error(f"Invalid export format: {format}")
-            raise ValueError(f"Invalid format. Must be 'dict', 'json', or 'csv'")
+        return payload.decode('utf-8')
+
+    def _export_csv(self, account_info: Mapping[str, Any], filepath: Optional[str]) -> str:
+        """Write the account info as Field,Value rows (default: account_info.csv)."""
+        import csv
+
+        if not filepath:
+            filepath = 'account_info.csv'
+
+        with open(filepath, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('Field', 'Value'))
+            writer.writerows(account_info.items())
+
+        logger.info("Account info exported to {}", filepath)
+        return f"Exported to {filepath}"
 
 
 logger.info("MT5Account module loaded")
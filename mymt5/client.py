@@ -13,13 +13,154 @@ from datetime import datetime
 import time
 import json
 import os
+import queue
+import threading
 from pathlib import Path
 from .enums import ConnectionState
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is used instead
+    orjson = None
+
 
 logger.info("Loading client module")
 
 
+def _write_bytes(filepath: str, payload: bytes, mode: str, durable: bool = False) -> None:
+    """
+    Write an encoded payload to a file in a single call.
+
+    Args:
+        filepath: Destination file path
+        payload: Encoded data
+        mode: Binary open mode ('wb' to overwrite, 'ab' to append)
+        durable: Flush and fsync before returning, so the data survives a crash
+    """
+    with open(filepath, mode) as f:
+        f.write(payload)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def _replace_file(filepath: str, payload: bytes, durable: bool = False) -> None:
+    """
+    Atomically replace a file with an encoded payload.
+
+    The payload is written to a sibling ``.tmp`` file which is then renamed over
+    the destination, so a crash mid-write never leaves a truncated file behind.
+
+    Args:
+        filepath: Destination file path
+        payload: Encoded data
+        durable: Fsync the temporary file before it is renamed into place
+    """
+    tmp_path = f"{filepath}.tmp"
+    try:
+        _write_bytes(tmp_path, payload, 'wb', durable)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        # Leave the destination untouched and clean up the partial temp file
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_json(
+    filepath: str,
+    data: Any,
+    default: Optional[Callable] = None,
+    durable: bool = False
+) -> None:
+    """
+    Write data to a file as indented JSON.
+
+    Uses orjson when it is installed (2-space indent) and falls back to the
+    standard json module otherwise. Either way the data is fully encoded
+    before any file is opened, then written as bytes in one call and moved
+    into place atomically (an existing file survives encoding errors and
+    crashes).
+
+    Args:
+        filepath: Destination file path
+        data: JSON-serializable data
+        default: Fallback serializer for unsupported objects
+        durable: Flush and fsync the file before returning
+    """
+    if orjson is not None:
+        payload = orjson.dumps(
+            data, default=default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    else:
+        # Encode first, then write once (json.dump writes chunk by chunk)
+        payload = json.dumps(data, indent=4, default=default).encode('utf-8')
+    _replace_file(filepath, payload, durable)
+
+
+def _append_json_line(
+    filepath: str,
+    data: Any,
+    default: Optional[Callable] = None,
+    durable: bool = False
+) -> None:
+    """
+    Append data to a file as one compact JSON line (JSON Lines format).
+
+    Earlier lines are never read or rewritten, so repeated appends stay cheap
+    and the file can be consumed incrementally.
+
+    Args:
+        filepath: Destination file path
+        data: JSON-serializable data
+        default: Fallback serializer for unsupported objects
+        durable: Flush and fsync the file before returning
+    """
+    if orjson is not None:
+        payload = orjson.dumps(
+            data, default=default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        )
+    else:
+        payload = (json.dumps(data, default=default) + '\n').encode('utf-8')
+    _write_bytes(filepath, payload, 'ab', durable)
+
+
+def _is_json_serializable(value: Any) -> bool:
+    """Return True if value can be encoded as JSON without a fallback serializer."""
+    try:
+        if orjson is not None:
+            orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        else:
+            json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _read_json(filepath: str) -> Any:
+    """
+    Read a JSON file.
+
+    Uses orjson when it is installed (the raw bytes are parsed in one call, with
+    no text decoding step) and falls back to the standard json module otherwise.
+
+    Args:
+        filepath: Source file path
+
+    Returns:
+        Parsed JSON data
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
 class MT5Client:
     """
     Main client class for MetaTrader 5 terminal interaction.
@@ -47,6 +188,40 @@ class MT5Client:
         >>> client.shutdown()
     """
 
+    # Every instance attribute set in __init__; no per-instance __dict__
+    __slots__ = (
+        # Connection
+        'connection_state', 'timeout', 'portable',
+        # Authentication
+        'account_login', 'account_password', 'account_server', 'path',
+        # Auto-reconnection
+        'auto_reconnect_enabled', 'retry_attempts', 'retry_delay',
+        '_reconnection_in_progress', '_reconnect_requested',
+        '_reconnect_queue', '_reconnect_thread', '_reconnect_stop',
+        # Configuration
+        'config', 'config_path',
+        # Multi-account support
+        'accounts', 'current_account',
+        # Event system
+        '_event_handlers',
+        # Connection statistics
+        '_connection_attempts', '_successful_connections', '_failed_connections',
+        '_last_connection_ns', '_last_connection_iso', '_total_connection_time',
+        # Error tracking
+        '_last_error', '_error_count',
+        # Terminal info cache
+        '_terminal_info_cache', '_terminal_info_ttl',
+    )
+
+    # Settings configure() writes as attributes (everything else goes to self.config)
+    _CONFIGURABLE_ATTRS = frozenset((
+        'path', 'timeout', 'portable',
+        'auto_reconnect_enabled', 'retry_attempts', 'retry_delay',
+    ))
+
+    # Seconds shutdown() waits for a running reconnection before moving on
+    _RECONNECT_JOIN_TIMEOUT = 5
+
     def __init__(
         self,
         timeout: int = 60000,
@@ -83,6 +258,11 @@ class MT5Client:
         self.retry_attempts: int = 3
         self.retry_delay: int = 5
         self._reconnection_in_progress: bool = False
+        # Reconnection runs on a background worker so is_connected() never blocks
+        self._reconnect_requested: bool = False
+        self._reconnect_queue: Optional[queue.SimpleQueue] = None
+        self._reconnect_thread: Optional[threading.Thread] = None
+        self._reconnect_stop: threading.Event = threading.Event()
 
         # Configuration attributes
         self.config: Dict[str, Any] = {}
@@ -92,26 +272,32 @@ class MT5Client:
         self.accounts: Dict[str, Dict[str, Any]] = {}
         self.current_account: str = ""
 
-        # Event system
-        self._event_handlers: Dict[str, List[Callable]] = {
-            'connect': [],
-            'disconnect': [],
-            'error': [],
-            'reconnect': [],
-            'account_switch': []
+        # Event system. Handler tuples are never mutated, only replaced, so
+        # trigger_event can iterate them while another thread calls on/off.
+        self._event_handlers: Dict[str, Tuple[Callable, ...]] = {
+            'connect': (),
+            'disconnect': (),
+            'error': (),
+            'reconnect': (),
+            'account_switch': ()
         }
 
         # Connection statistics
         self._connection_attempts: int = 0
         self._successful_connections: int = 0
         self._failed_connections: int = 0
-        self._last_connection_time: Optional[datetime] = None
+        self._last_connection_ns: Optional[int] = None  # time.time_ns() of last connect
+        self._last_connection_iso: Optional[str] = None  # ISO form, formatted once per connect
         self._total_connection_time: float = 0
 
         # Error tracking
         self._last_error: Optional[Tuple[int, str]] = None
         self._error_count: int = 0
 
+        # Short-lived cache of mt5.terminal_info() as (monotonic time, info)
+        self._terminal_info_cache: Tuple[float, Any] = (float('-inf'), None)
+        self._terminal_info_ttl: float = 0.2  # seconds
+
         logger.success("MT5Client initialized successfully")
 
     # =============================================================================
@@ -199,7 +385,9 @@ class MT5Client:
 
             self.connection_state = ConnectionState.CONNECTED
             self._successful_connections += 1
-            self._last_connection_time = datetime.now()
+            connected_ns = self._last_connection_ns = time.time_ns()
+            self._last_connection_iso = datetime.fromtimestamp(connected_ns / 1e9).isoformat()
+            self._invalidate_terminal_info()
 
             # Trigger connect event
             self.trigger_event('connect', client=self)
@@ -252,6 +440,7 @@ class MT5Client:
 
         try:
             self.connection_state = ConnectionState.DISCONNECTED
+            self._invalidate_terminal_info()
 
             # Trigger disconnect event
             self.trigger_event('disconnect', client=self)
@@ -279,11 +468,15 @@ class MT5Client:
         logger.info("Shutting down MT5 client")
 
         try:
+            # Stop the reconnection worker so it can't reconnect after shutdown
+            self._stop_reconnect_worker()
+
             # Disconnect first
             self.disconnect()
 
             # Shutdown MT5 terminal
             mt5.shutdown()
+            self._invalidate_terminal_info()
 
             self.connection_state = ConnectionState.DISCONNECTED
             logger.success("MT5 client shutdown successfully")
@@ -295,6 +488,9 @@ class MT5Client:
         """
         Check if client is currently connected to MT5 terminal.
 
+        If a dropped connection is detected and auto-reconnection is enabled,
+        a reconnection is queued on a background worker; this call does not wait.
+
         Returns:
             bool: True if connected, False otherwise
 
@@ -303,7 +499,7 @@ class MT5Client:
             ...     print("Currently connected")
         """
         # Check both our state and MT5's terminal info
-        terminal_info = mt5.terminal_info()
+        terminal_info = self._get_terminal_info()
         is_mt5_connected = terminal_info is not None and terminal_info.connected
 
         is_our_state_connected = self.connection_state == ConnectionState.CONNECTED
@@ -313,13 +509,33 @@ class MT5Client:
             logger.warning("Connection state mismatch detected - updating state")
             self.connection_state = ConnectionState.DISCONNECTED
 
-            # Attempt auto-reconnection if enabled
+            # Attempt auto-reconnection if enabled (in the background)
             if self.auto_reconnect_enabled and not self._reconnection_in_progress:
-                logger.info("Initiating auto-reconnection")
-                self._handle_reconnection()
+                self._request_reconnection()
 
         return is_mt5_connected and is_our_state_connected
 
+    def _get_terminal_info(self) -> Any:
+        """
+        Get terminal info, cached for _terminal_info_ttl seconds.
+
+        Connection polling (is_connected, ping) would otherwise query the
+        terminal on every call.
+
+        Returns:
+            Terminal info named tuple, or None if unavailable
+        """
+        now = time.monotonic()
+        fetched_at, terminal_info = self._terminal_info_cache
+        if now - fetched_at >= self._terminal_info_ttl:
+            terminal_info = mt5.terminal_info()
+            self._terminal_info_cache = (now, terminal_info)
+        return terminal_info
+
+    def _invalidate_terminal_info(self) -> None:
+        """Drop the cached terminal info so the next check queries MT5."""
+        self._terminal_info_cache = (float('-inf'), None)
+
     def ping(self) -> bool:
         """
         Ping the MT5 terminal to check connection health.
@@ -332,7 +548,7 @@ class MT5Client:
             ...     print("Connection is healthy")
         """
         try:
-            terminal_info = mt5.terminal_info()
+            terminal_info = self._get_terminal_info()
             if terminal_info is not None:
                 logger.debug("Ping successful")
                 return True
@@ -374,6 +590,7 @@ class MT5Client:
         try:
             # Attempt authorization
             authorized = mt5.login(login=login, password=password, server=server)
+            self._invalidate_terminal_info()
 
             if authorized:
                 self.account_login = login
@@ -436,6 +653,19 @@ class MT5Client:
             >>> if not client.is_connected():
             ...     client.reconnect()
         """
+        return self._reconnect()
+
+    def _reconnect(self, stop: Optional[threading.Event] = None) -> bool:
+        """
+        Reconnect with the stored credentials.
+
+        Args:
+            stop: Event that cancels the reconnection during its pause before
+                reinitializing (set by shutdown() for the background worker)
+
+        Returns:
+            bool: True if reconnection successful, False otherwise
+        """
         logger.info("Attempting reconnection to MT5 terminal")
         self.connection_state = ConnectionState.RECONNECTING
 
@@ -450,7 +680,11 @@ class MT5Client:
             pass
 
         # Wait a moment before reconnecting
-        time.sleep(1)
+        if stop is None:
+            time.sleep(1)
+        elif stop.wait(1):
+            logger.info("Reconnection cancelled by shutdown")
+            return False
 
         # Attempt to reinitialize and login
         success = self.initialize(
@@ -526,6 +760,72 @@ class MT5Client:
         self.retry_delay = delay
         logger.info(f"Retry delay set to {delay} seconds")
 
+    def _request_reconnection(self) -> None:
+        """
+        Queue an auto-reconnection on the background worker, starting it if needed.
+
+        Requests made while one is already pending are dropped.
+        """
+        if self._reconnect_requested:
+            return
+
+        logger.info("Initiating auto-reconnection")
+        self._reconnect_requested = True
+
+        requests = self._reconnect_queue
+        if (requests is None or self._reconnect_thread is None
+                or not self._reconnect_thread.is_alive()):
+            # Each worker gets its own queue and stop event, so a stopping worker
+            # can't take new requests and a new worker isn't cancelled by an old stop
+            requests = self._reconnect_queue = queue.SimpleQueue()
+            self._reconnect_stop = threading.Event()
+            self._reconnect_thread = threading.Thread(
+                target=self._reconnect_worker,
+                args=(requests,),
+                name="MT5Client-reconnect",
+                daemon=True
+            )
+            self._reconnect_thread.start()
+
+        requests.put_nowait(True)
+
+    def _stop_reconnect_worker(self) -> None:
+        """
+        Stop the background reconnection worker (if any) and wait for it to exit.
+
+        A reconnection that is already running is cancelled at its next pause
+        or retry check. A call into the terminal (mt5.initialize can take up to
+        the connection timeout) can't be interrupted, so the wait is bounded by
+        _RECONNECT_JOIN_TIMEOUT and a warning is logged if the worker is still busy.
+        """
+        thread = self._reconnect_thread
+        requests = self._reconnect_queue
+        if thread is not None and requests is not None:
+            self._reconnect_stop.set()
+            requests.put_nowait(False)
+            self._reconnect_thread = None
+            # A 'reconnect' event handler may call shutdown() from the worker itself
+            if thread is not threading.current_thread():
+                thread.join(self._RECONNECT_JOIN_TIMEOUT)
+                if thread.is_alive():
+                    logger.warning(
+                        f"Reconnection worker still waiting on the MT5 terminal after "
+                        f"{self._RECONNECT_JOIN_TIMEOUT}s; continuing shutdown"
+                    )
+        self._reconnect_requested = False
+
+    def _reconnect_worker(self, requests: queue.SimpleQueue) -> None:
+        """
+        Background loop that runs queued reconnections one at a time.
+
+        Args:
+            requests: Queue of requests; True to reconnect, False to exit
+        """
+        while requests.get() and not self._reconnect_stop.is_set():
+            self._reconnect_requested = False
+            if self.auto_reconnect_enabled:
+                self._handle_reconnection()
+
     def _handle_reconnection(self) -> bool:
         """
         Internal method to handle automatic reconnection logic.
@@ -538,21 +838,30 @@ class MT5Client:
 
         self._reconnection_in_progress = True
         logger.info("Starting auto-reconnection process")
+        stop = self._reconnect_stop
 
         for attempt in range(1, self.retry_attempts + 1):
+            if stop.is_set():
+                break
+
             logger.info(f"Reconnection attempt {attempt}/{self.retry_attempts}")
 
-            if self.reconnect():
+            if self._reconnect(stop):
                 self._reconnection_in_progress = False
                 logger.success("Auto-reconnection successful")
                 return True
 
             if attempt < self.retry_attempts:
                 logger.info(f"Waiting {self.retry_delay} seconds before next attempt")
-                time.sleep(self.retry_delay)
+                # Returns early if shutdown() stops the worker during the wait
+                if stop.wait(self.retry_delay):
+                    break
 
         self._reconnection_in_progress = False
-        logger.error("Auto-reconnection failed after all attempts")
+        if stop.is_set():
+            logger.info("Auto-reconnection cancelled by shutdown")
+        else:
+            logger.error("Auto-reconnection failed after all attempts")
         return False
 
     # =============================================================================
@@ -563,7 +872,10 @@ class MT5Client:
         """
         Configure client settings.
 
-        Accepts any key-value pairs to update client configuration.
+        Accepts any key-value pairs to update client configuration. Client
+        settings (path, timeout, portable, auto_reconnect_enabled,
+        retry_attempts, retry_delay) are set as attributes; any other key is
+        stored as a custom setting in self.config.
 
         Args:
             **kwargs: Configuration parameters
@@ -578,7 +890,7 @@ class MT5Client:
         logger.info(f"Updating configuration with {len(kwargs)} parameters")
 
         for key, value in kwargs.items():
-            if hasattr(self, key):
+            if key in self._CONFIGURABLE_ATTRS:
                 setattr(self, key, value)
                 logger.debug(f"Set {key} = {value}")
             else:
@@ -615,7 +927,7 @@ class MT5Client:
             return config_dict
         else:
             # Return specific config value
-            if hasattr(self, key):
+            if key in self._CONFIGURABLE_ATTRS:
                 return getattr(self, key)
             else:
                 return self.config.get(key)
@@ -636,8 +948,7 @@ class MT5Client:
         logger.info(f"Loading configuration from {filepath}")
 
         try:
-            with open(filepath, 'r') as f:
-                config = json.load(f)
+            config = _read_json(filepath)
 
             self.configure(**config)
             self.config_path = filepath
@@ -672,19 +983,19 @@ class MT5Client:
         logger.info(f"Saving configuration to {filepath}")
 
         try:
-            config = self.get_config()
-
-            # Remove non-serializable items
-            config_to_save = {
-                k: v for k, v in config.items()
-                if isinstance(v, (str, int, float, bool, list, dict, type(None)))
-            }
+            config_to_save = self.get_config()
 
             # Don't save sensitive data
             config_to_save.pop('password', None)
 
-            with open(filepath, 'w') as f:
-                json.dump(config_to_save, f, indent=4)
+            try:
+                _write_json(filepath, config_to_save)
+            except TypeError:
+                # Remove non-serializable items and write the rest
+                config_to_save = {
+                    k: v for k, v in config_to_save.items() if _is_json_serializable(v)
+                }
+                _write_json(filepath, config_to_save)
 
             self.config_path = filepath
             logger.success(f"Configuration saved to {filepath}")
@@ -732,8 +1043,8 @@ class MT5Client:
         logger.info(f"Switching to account: {account_name}")
 
         # Check if account is saved
-        if account_name in self.accounts:
-            account_info = self.accounts[account_name]
+        account_info = self.accounts.get(account_name)
+        if account_info is not None:
             login = account_info['login']
             password = account_info['password']
             server = account_info['server']
@@ -747,8 +1058,8 @@ class MT5Client:
             self.current_account = account_name
 
             # Save account if not already saved
-            if account_name not in self.accounts:
-                self.save_account(account_name, login, password, server)
+            if account_info is None:
+                self.save_account(account_name, login, password, server, self.path)
 
             # Trigger account switch event
             self.trigger_event('account_switch', client=self, account=account_name)
@@ -784,7 +1095,7 @@ class MT5Client:
             'password': password,
             'server': server,
             'path': path,
-            'saved_at': datetime.now().isoformat()
+            'saved_at': time.time_ns()
         }
         logger.success(f"Account '{account_name}' saved")
 
@@ -804,8 +1115,7 @@ class MT5Client:
         logger.info(f"Loading accounts from {filepath}")
 
         try:
-            with open(filepath, 'r') as f:
-                accounts = json.load(f)
+            accounts = _read_json(filepath)
 
             self.accounts.update(accounts)
             logger.success(f"Loaded {len(accounts)} accounts from {filepath}")
@@ -827,7 +1137,7 @@ class MT5Client:
             >>> print(accounts)
             ['demo_account', 'live_account']
         """
-        return list(self.accounts.keys())
+        return list(self.accounts)
 
     def remove_account(self, account_name: str) -> bool:
         """
@@ -870,10 +1180,7 @@ class MT5Client:
             >>>
             >>> client.on('connect', on_connect)
         """
-        if event not in self._event_handlers:
-            self._event_handlers[event] = []
-
-        self._event_handlers[event].append(callback)
+        self._event_handlers[event] = self._event_handlers.get(event, ()) + (callback,)
         logger.debug(f"Registered callback for '{event}' event")
 
     def off(self, event: str, callback: Optional[Callable] = None) -> None:
@@ -891,12 +1198,14 @@ class MT5Client:
         if event in self._event_handlers:
             if callback is None:
                 # Remove all callbacks for this event
-                self._event_handlers[event] = []
+                self._event_handlers[event] = ()
                 logger.debug(f"Removed all callbacks for '{event}' event")
             else:
-                # Remove specific callback
-                if callback in self._event_handlers[event]:
-                    self._event_handlers[event].remove(callback)
+                # Remove specific callback (first registration only)
+                handlers = self._event_handlers[event]
+                if callback in handlers:
+                    index = handlers.index(callback)
+                    self._event_handlers[event] = handlers[:index] + handlers[index + 1:]
                     logger.debug(f"Removed callback for '{event}' event")
 
     def trigger_event(self, event: str, **kwargs) -> None:
@@ -910,12 +1219,16 @@ class MT5Client:
         Example:
             >>> client.trigger_event('connect', client=client)
         """
-        if event in self._event_handlers:
-            for callback in self._event_handlers[event]:
-                try:
-                    callback(**kwargs)
-                except Exception as e:
-                    logger.error(f"Error executing callback for '{event}': {e}")
+        # Snapshot the handler tuple; on/off replace it rather than mutate it
+        handlers = self._event_handlers.get(event)
+        if not handlers:
+            return
+
+        for callback in handlers:
+            try:
+                callback(**kwargs)
+            except Exception as e:
+                logger.error(f"Error executing callback for '{event}': {e}")
 
     # =============================================================================
     # STATUS & DIAGNOSTICS
@@ -933,9 +1246,13 @@ class MT5Client:
             >>> print(status['connection_state'])
             >>> print(status['account_info'])
         """
+        is_connected = self.is_connected()
+        # Reuses the terminal info is_connected() just fetched
+        terminal_info = self._get_terminal_info()
+
         return {
-            'connection_state': str(self.connection_state),
-            'is_connected': self.is_connected(),
+            'connection_state': self.connection_state.value,
+            'is_connected': is_connected,
             'account_info': {
                 'login': self.account_login,
                 'server': self.account_server,
@@ -946,10 +1263,17 @@ class MT5Client:
                 'retry_attempts': self.retry_attempts,
                 'retry_delay': self.retry_delay
             },
-            'terminal_info': mt5.terminal_info()._asdict() if mt5.terminal_info() else None,
+            'terminal_info': terminal_info._asdict() if terminal_info else None,
             'statistics': self.get_connection_statistics()
         }
 
+    @property
+    def last_connection_time(self) -> Optional[datetime]:
+        """Local time of the last successful connection, or None if never connected."""
+        if self._last_connection_ns is None:
+            return None
+        return datetime.fromtimestamp(self._last_connection_ns / 1e9)
+
     def get_connection_statistics(self) -> Dict[str, Any]:
         """
         Get connection statistics and metrics.
@@ -972,10 +1296,7 @@ class MT5Client:
             'successful_connections': self._successful_connections,
             'failed_connections': self._failed_connections,
             'success_rate': success_rate,
-            'last_connection_time': (
-                self._last_connection_time.isoformat()
-                if self._last_connection_time else None
-            ),
+            'last_connection_time': self._last_connection_iso,
             'error_count': self._error_count,
             'last_error': self._last_error
         }
@@ -1020,11 +1341,13 @@ class MT5Client:
         """
         self._last_error = error
         self._error_count += 1
+        self._invalidate_terminal_info()
 
-        # Trigger error event
-        self.trigger_event('error', client=self, error=error)
+        # Trigger error event (skipped outright when nobody listens)
+        if self._event_handlers.get('error'):
+            self.trigger_event('error', client=self, error=error)
 
-        logger.error(f"Error {error[0]}: {error[1]}")
+        logger.error("Error {}: {}", error[0], error[1])
 
     # =============================================================================
     # UTILITY METHODS
@@ -1041,14 +1364,17 @@ class MT5Client:
         """
         logger.info("Resetting MT5 client")
 
-        # Shutdown connection
-        self.shutdown()
+        # Shutdown connection, unless the terminal was never initialized
+        # (a fresh or already-reset client has nothing to shut down)
+        if self._connection_attempts or self.connection_state is not ConnectionState.DISCONNECTED:
+            self.shutdown()
 
         # Reset connection statistics
         self._connection_attempts = 0
         self._successful_connections = 0
         self._failed_connections = 0
-        self._last_connection_time = None
+        self._last_connection_ns = None
+        self._last_connection_iso = None
         self._total_connection_time = 0
 
         # Reset error tracking
@@ -1063,36 +1389,54 @@ class MT5Client:
         # Reset state
         self.connection_state = ConnectionState.DISCONNECTED
         self._reconnection_in_progress = False
+        self._invalidate_terminal_info()
 
         logger.success("MT5 client reset complete")
 
-    def export_logs(self, filepath: str, include_mt5_logs: bool = False) -> bool:
+    def export_logs(
+        self,
+        filepath: str,
+        include_mt5_logs: bool = False,
+        append: bool = False,
+        durable: bool = False
+    ) -> bool:
         """
         Export client logs and statistics to a file.
 
         Args:
             filepath: Path to save log file
             include_mt5_logs: Whether to include MT5 terminal logs
+            append: Append one compact JSON line to the file (JSON Lines)
+                instead of overwriting it with an indented JSON document
+            durable: Flush and fsync the file before returning (slower, but the
+                export survives a crash or power loss). Overwriting exports are
+                always written to a temporary file and renamed into place, so
+                a crash never leaves a truncated JSON document
 
         Returns:
             bool: True if export successful
 
         Example:
             >>> client.export_logs('client_logs.json')
+            >>> client.export_logs('client_logs.jsonl', append=True)
         """
         logger.info(f"Exporting logs to {filepath}")
 
         try:
+            status = self.get_status()
             log_data = {
                 'timestamp': datetime.now().isoformat(),
-                'client_status': self.get_status(),
-                'statistics': self.get_connection_statistics(),
+                'client_status': status,
+                # Same statistics get_status() just gathered
+                'statistics': status['statistics'],
                 'configuration': self.get_config(),
-                'saved_accounts': list(self.accounts.keys()),
+                'saved_accounts': list(self.accounts),
             }
 
-            with open(filepath, 'w') as f:
-                json.dump(log_data, f, indent=4, default=str)
+            if append:
+                _append_json_line(filepath, log_data, default=str, durable=durable)
+            else:
+                _write_json(filepath, log_data, default=str, durable=durable)
 
             logger.success(f"Logs exported to {filepath}")
             return True
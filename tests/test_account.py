@@ -1,9 +1,13 @@
 """Tests for MT5Account class"""
 
 from mylogger import logger
+import json
+import numpy as np
 import pytest
 from unittest.mock import Mock, MagicMock, patch
+from collections.abc import Mapping
 from datetime import datetime
+import mymt5.account as account_module
 from mymt5.account import MT5Account
 
 
@@ -78,12 +82,24 @@ class TestMT5AccountGet:
 
         result = account.get()
 
-        assert isinstance(result, dict)
+        assert isinstance(result, Mapping)
         assert result['login'] == 12345678
         assert result['balance'] == 10000.0
         assert result['equity'] == 10500.0
         assert result['currency'] == 'USD'
 
+    @patch('mymt5.account.mt5')
+    def test_get_all_info_is_a_copy(self, mock_mt5, account, mock_account_info):
+        """Test that the returned account info is a plain dict that can't modify the cache"""
+        mock_mt5.account_info.return_value = mock_account_info
+
+        result = account.get()
+
+        assert type(result) is dict
+        json.dumps(result)
+        result['balance'] = 0.0
+        assert account.get('balance') == 10000.0
+
     @patch('mymt5.account.mt5')
     def test_get_specific_attribute(self, mock_mt5, account, mock_account_info):
         """Test getting specific account attribute"""
@@ -144,9 +160,11 @@ class TestMT5AccountFetchInfo:
 
         result = account._fetch_account_info()
 
-        assert isinstance(result, dict)
+        assert isinstance(result, Mapping)
         assert len(result) > 0
         assert result['login'] == 12345678
+        with pytest.raises(TypeError):
+            result['login'] = 0
 
     @patch('mymt5.account.mt5')
     def test_fetch_failure(self, mock_mt5, account):
@@ -219,6 +237,17 @@ class TestMT5AccountCalculate:
         # equity / margin * 100 = 10500 / 1000 * 100 = 1050
         assert margin_level == 1050.0
 
+    @patch('mymt5.account.logger')
+    @patch('mymt5.account.mt5')
+    def test_calculate_log_placeholders(self, mock_mt5, mock_logger, account, mock_account_info):
+        """Test log arguments use {} placeholders, which the logger fills with str.format"""
+        mock_mt5.account_info.return_value = mock_account_info
+
+        account.calculate('margin_level')
+
+        message, *args = mock_logger.info.call_args[0]
+        assert message.format(*args) == "Calculated margin level: 1050.00%"
+
     @patch('mymt5.account.mt5')
     def test_calculate_margin_level_zero_margin(self, mock_mt5, account, mock_account_info):
         """Test margin level with zero margin"""
@@ -262,6 +291,16 @@ class TestMT5AccountCalculate:
         assert 'health_status' in health
         assert health['health_status'] == 'excellent'  # margin_level > 200
 
+    @patch('mymt5.account.mt5')
+    def test_calculate_health_fetches_once(self, mock_mt5, account, mock_account_info):
+        """Test health metrics reuse one account info fetch"""
+        mock_mt5.account_info.return_value = mock_account_info
+        account._cache_duration = 0  # Every fetch would hit MT5
+
+        account.calculate('health')
+
+        mock_mt5.account_info.assert_called_once()
+
     @patch('mymt5.account.mt5')
     def test_calculate_margin_required(self, mock_mt5, account):
         """Test calculating required margin"""
@@ -277,11 +316,79 @@ class TestMT5AccountCalculate:
         assert margin == 1000.0
         mock_mt5.order_calc_margin.assert_called_once()
 
+    @patch('mymt5.account.mt5')
+    def test_calculate_margin_required_from_tick(self, mock_mt5, account):
+        """Test price falls back to the current tick when symbol_info has none"""
+        mock_mt5.symbol_info.return_value = Mock(ask=0.0, bid=0.0, last=1.0990)
+        mock_mt5.symbol_info_tick.return_value = Mock(ask=0.0, bid=1.1002, last=0.0)
+        mock_mt5.order_calc_margin.return_value = 1000.0
+
+        account.calculate('margin_required', symbol='EURUSD', volume=1.0)
+
+        assert mock_mt5.order_calc_margin.call_args[0][3] == 1.1002
+        mock_mt5.copy_ticks_from.assert_not_called()
+
+    @patch('mymt5.account.mt5')
+    def test_calculate_margin_required_from_recent_ticks(self, mock_mt5, account):
+        """Test price falls back to the last tick with a usable price"""
+        mock_mt5.symbol_info.return_value = Mock(ask=0.0, bid=0.0, last=0.0)
+        mock_mt5.symbol_info_tick.return_value = None
+        mock_mt5.copy_ticks_from.return_value = np.array(
+            [(1.1010, 1.1008, 0.0), (0.0, 1.1005, 0.0), (0.0, 0.0, 0.0)],
+            dtype=[('ask', 'f8'), ('bid', 'f8'), ('last', 'f8')],
+        )
+        mock_mt5.order_calc_margin.return_value = 1000.0
+
+        account.calculate('margin_required', symbol='EURUSD', volume=1.0)
+
+        # The newest usable tick only has a bid, which beats an older ask
+        assert mock_mt5.order_calc_margin.call_args[0][3] == 1.1005
+
+    @patch('mymt5.account.mt5')
+    def test_calculate_margin_required_from_m1_close(self, mock_mt5, account):
+        """Test price falls back to the M1 close after a failing tick source"""
+        mock_mt5.symbol_info.return_value = Mock(ask=0.0, bid=0.0, last=0.0)
+        mock_mt5.symbol_info_tick.return_value = None
+        mock_mt5.copy_ticks_from.side_effect = RuntimeError("no ticks")
+        mock_mt5.copy_rates_from_pos.return_value = np.array(
+            [(1.1001,)], dtype=[('close', 'f8')]
+        )
+        mock_mt5.order_calc_margin.return_value = 1000.0
+
+        account.calculate('margin_required', symbol='EURUSD', volume=1.0)
+
+        assert mock_mt5.order_calc_margin.call_args[0][3] == 1.1001
+
+    @patch('mymt5.account.mt5')
+    def test_calculate_margin_required_no_price(self, mock_mt5, account):
+        """Test RuntimeError when no price source has a usable price"""
+        mock_mt5.symbol_info.return_value = Mock(ask=0.0, bid=0.0, last=0.0)
+        mock_mt5.symbol_info_tick.return_value = None
+        mock_mt5.copy_ticks_from.return_value = None
+        mock_mt5.copy_rates_from_pos.return_value = None
+        mock_mt5.last_error.return_value = (1, "No data")
+
+        with pytest.raises(RuntimeError, match="No valid price"):
+            account.calculate('margin_required', symbol='EURUSD', volume=1.0)
+
+        mock_mt5.order_calc_margin.assert_not_called()
+
     def test_calculate_invalid_metric(self, account):
         """Test invalid metric raises ValueError"""
         with pytest.raises(ValueError, match="Invalid metric"):
             account.calculate('invalid_metric')
 
+    @patch('mymt5.account.mt5')
+    def test_calculate_rejects_unknown_keywords(self, mock_mt5, account, mock_account_info):
+        """Test misspelled keywords and the internal info parameter raise TypeError"""
+        mock_mt5.account_info.return_value = mock_account_info
+
+        with pytest.raises(TypeError):
+            account.calculate('drawdown', typ='absolute')
+
+        with pytest.raises(TypeError, match="info"):
+            account.calculate('margin_level', info={'margin': 1.0, 'equity': 2.0})
+
 
 class TestMT5AccountValidateCredentials:
     """Test MT5Account.validate_credentials() method"""
@@ -332,6 +439,17 @@ class TestMT5AccountGetSummary:
         assert summary['trade_mode'] == 'Demo'
         assert 'health_status' in summary
 
+    @patch('mymt5.account.mt5')
+    def test_get_summary_matches_health(self, mock_mt5, account, mock_account_info):
+        """Test summary margin level and status agree with health metrics"""
+        mock_mt5.account_info.return_value = mock_account_info
+
+        summary = account.get_summary()
+        health = account.calculate('health')
+
+        assert summary['margin_level'] == health['margin_level']
+        assert summary['health_status'] == health['health_status']
+
 
 class TestMT5AccountExport:
     """Test MT5Account.export() method"""
@@ -356,6 +474,29 @@ class TestMT5AccountExport:
         assert isinstance(result, str)
         assert '12345678' in result
 
+    @patch('mymt5.account.mt5')
+    def test_export_json_without_orjson(self, mock_mt5, account, mock_account_info):
+        """Test JSON export falls back to the json module without orjson"""
+        mock_mt5.account_info.return_value = mock_account_info
+
+        with_orjson = account.export('json')
+        with patch('mymt5.account.orjson', None):
+            without_orjson = account.export('json')
+
+        assert json.loads(without_orjson) == json.loads(with_orjson)
+
+    @patch('mymt5.account.mt5')
+    def test_export_json_numpy_values(self, mock_mt5, account, mock_account_info):
+        """Test non-native numeric values are coerced before JSON export"""
+        mock_account_info.login = np.int64(12345678)
+        mock_account_info.balance = np.float64(10000.0)
+        mock_mt5.account_info.return_value = mock_account_info
+
+        result = account.export('json')
+
+        assert '"login": 12345678' in result
+        assert '"balance": 10000.0' in result
+
     @patch('mymt5.account.mt5')
     def test_export_json_with_file(self, mock_mt5, account, mock_account_info, tmp_path):
         """Test exporting as JSON with file"""
@@ -367,6 +508,20 @@ class TestMT5AccountExport:
         assert "Exported to" in result
         assert filepath.exists()
 
+    @patch('mymt5.account.mt5')
+    def test_export_json_with_file_non_ascii(self, mock_mt5, account, mock_account_info, tmp_path):
+        """Test non-ASCII account names are written as UTF-8 with and without orjson"""
+        mock_account_info.name = "Трейдер 株式会社"
+        mock_mt5.account_info.return_value = mock_account_info
+        filepath = tmp_path / "account.json"
+
+        for orjson_module in (account_module.orjson, None):
+            with patch('mymt5.account.orjson', orjson_module):
+                account.export('json', str(filepath))
+
+            saved = json.loads(filepath.read_bytes().decode('utf-8'))
+            assert saved['name'] == "Трейдер 株式会社"
+
     @patch('mymt5.account.mt5')
     def test_export_csv(self, mock_mt5, account, mock_account_info, tmp_path):
         """Test exporting as CSV"""
@@ -377,6 +532,9 @@ class TestMT5AccountExport:
 
         assert "Exported to" in result
         assert filepath.exists()
+        rows = filepath.read_text().splitlines()
+        assert rows[0] == 'Field,Value'
+        assert 'balance,10000.0' in rows
 
     @patch('mymt5.account.mt5')
     def test_export_invalid_format(self, mock_mt5, account, mock_account_info):
@@ -386,5 +544,13 @@ class TestMT5AccountExport:
         with pytest.raises(ValueError, match="Invalid format"):
             account.export('invalid')
 
+    @patch('mymt5.account.mt5')
+    def test_export_invalid_format_skips_fetch(self, mock_mt5, account):
+        """Test invalid export format is rejected before querying MT5"""
+        with pytest.raises(ValueError, match="Invalid format"):
+            account.export('invalid')
+
+        mock_mt5.account_info.assert_not_called()
+
 
 logger.info("test_account module loaded")
@@ -12,7 +12,9 @@ from unittest.mock import Mock, patch, MagicMock, mock_open
 import MetaTrader5 as mt5
 from datetime import datetime
 import json
+import time
 
+import mymt5.client
 from mymt5.client import MT5Client
 from mymt5.enums import ConnectionState
 
@@ -84,6 +86,13 @@ class TestInitialization:
         assert client.timeout == 30000
         assert client.portable is True
 
+    def test_client_uses_slots(self, client):
+        """Test that client attributes live in slots, not an instance dict."""
+        assert not hasattr(client, '__dict__')
+
+        with pytest.raises(AttributeError):
+            client.unknown_attribute = 1
+
 
 # =============================================================================
 # CONNECTION MANAGEMENT TESTS
@@ -182,6 +191,18 @@ class TestConnectionManagement:
 
         assert client.ping() is False
 
+    def test_terminal_info_cached_between_checks(self, client, mock_mt5):
+        """Test repeated connection checks share one terminal_info call."""
+        client.connection_state = ConnectionState.CONNECTED
+
+        assert client.is_connected() is True
+        assert client.ping() is True
+        assert mock_mt5['terminal_info'].call_count == 1
+
+        client.disconnect()  # Invalidates the cache
+        client.ping()
+        assert mock_mt5['terminal_info'].call_count == 2
+
 
 # =============================================================================
 # AUTHENTICATION TESTS
@@ -278,34 +299,105 @@ class TestAutoReconnection:
 
         assert client.retry_delay == 15
 
-    @patch('time.sleep')
-    def test_handle_reconnection_success(self, mock_sleep, client, mock_mt5):
+    def test_handle_reconnection_success(self, client, mock_mt5):
         """Test successful auto-reconnection handling."""
         client.account_login = 12345
         client.account_password = "pass"
         client.account_server = "Server"
         client.retry_attempts = 2
+        client._reconnect_stop = Mock(is_set=Mock(return_value=False),
+                                      wait=Mock(return_value=False))
 
         result = client._handle_reconnection()
 
         assert result is True
         assert client._reconnection_in_progress is False
 
-    @patch('time.sleep')
-    def test_handle_reconnection_failure(self, mock_sleep, client, mock_mt5):
+    def test_handle_reconnection_failure(self, client, mock_mt5):
         """Test failed auto-reconnection after all attempts."""
         mock_mt5['initialize'].return_value = False
         client.account_login = 12345
         client.account_password = "pass"
         client.account_server = "Server"
         client.retry_attempts = 2
+        client.retry_delay = 3
+        stop = client._reconnect_stop = Mock(is_set=Mock(return_value=False),
+                                             wait=Mock(return_value=False))
 
         result = client._handle_reconnection()
 
         assert result is False
-        # Sleep is called in reconnect() and between attempts
-        # With 2 attempts: reconnect sleeps twice + 1 sleep between attempts = 3 total
-        assert mock_sleep.call_count >= 1  # At least between attempts
+        assert mock_mt5['initialize'].call_count == 2
+        # The pause before each attempt and the retry delay wait on the stop event
+        assert stop.wait.call_args_list == [((1,),), ((3,),), ((1,),)]
+
+    def test_is_connected_queues_reconnection(self, client, mock_mt5):
+        """Test a dropped connection is reconnected in the background."""
+        import threading
+
+        reconnected = threading.Event()
+        client.connection_state = ConnectionState.CONNECTED
+        client.enable_auto_reconnect(retry_attempts=1, retry_delay=0)
+        mock_mt5['terminal_info'].return_value = Mock(connected=False)
+
+        with patch.object(MT5Client, '_handle_reconnection', side_effect=reconnected.set) as handle:
+            assert client.is_connected() is False
+            assert reconnected.wait(timeout=5)
+            client.shutdown()
+
+        handle.assert_called_once()
+        assert client._reconnect_thread is None
+
+    @patch('time.sleep')
+    def test_shutdown_cancels_running_reconnection(self, mock_sleep, client, mock_mt5):
+        """Test shutdown() stops a reconnection waiting between attempts."""
+        import threading
+
+        attempted = threading.Event()
+        mock_mt5['initialize'].side_effect = lambda *args, **kwargs: attempted.set() or False
+        client.account_login = 12345
+        client.account_password = "pass"
+        client.account_server = "Server"
+        client.connection_state = ConnectionState.CONNECTED
+        client.enable_auto_reconnect(retry_attempts=3, retry_delay=30)
+        mock_mt5['terminal_info'].return_value = Mock(connected=False)
+
+        assert client.is_connected() is False
+        assert attempted.wait(timeout=5)
+
+        start = time.monotonic()
+        client.shutdown()
+
+        assert time.monotonic() - start < 5
+        assert client._reconnect_thread is None
+        assert client._reconnection_in_progress is False
+        mock_mt5['initialize'].assert_called_once()
+
+    def test_shutdown_join_is_bounded(self, client, mock_mt5):
+        """Test shutdown() stops waiting for a worker stuck in a terminal call."""
+        import threading
+
+        release = threading.Event()
+        entered = threading.Event()
+
+        def stuck_reconnection():
+            entered.set()
+            release.wait(10)
+
+        client.enable_auto_reconnect(retry_attempts=1, retry_delay=0)
+        with patch.object(MT5Client, '_RECONNECT_JOIN_TIMEOUT', 0.1), \
+             patch.object(MT5Client, '_handle_reconnection', side_effect=stuck_reconnection), \
+             patch('mymt5.client.logger') as mock_logger:
+            client._request_reconnection()
+            assert entered.wait(timeout=5)
+
+            start = time.monotonic()
+            client.shutdown()
+            elapsed = time.monotonic() - start
+            release.set()
+
+        assert elapsed < 5
+        mock_logger.warning.assert_called()
 
 
 # =============================================================================
@@ -325,6 +417,14 @@ class TestConfiguration:
         assert client.timeout == 30000
         assert client.config['custom_setting'] == "value"
 
+    def test_configure_does_not_overwrite_methods(self, client):
+        """Test keys naming non-setting attributes are stored as custom config."""
+        client.configure(login="not-a-method")
+
+        assert callable(client.login)
+        assert client.config['login'] == "not-a-method"
+        assert client.get_config('login') == "not-a-method"
+
     def test_get_config_all(self, client):
         """Test getting all configuration."""
         config = client.get_config()
@@ -352,12 +452,53 @@ class TestConfiguration:
 
     def test_save_config(self, client):
         """Test saving configuration to file."""
-        with patch('builtins.open', mock_open()) as mock_file:
+        with patch('builtins.open', mock_open()) as mock_file, \
+             patch('mymt5.client.os.replace') as mock_replace:
             result = client.save_config('config.json')
 
         assert result is True
         assert client.config_path == 'config.json'
         mock_file.assert_called_once()
+        mock_replace.assert_called_once_with('config.json.tmp', 'config.json')
+
+    def test_save_config_without_orjson(self, client, tmp_path):
+        """Test saving configuration falls back to the json module."""
+        filepath = tmp_path / 'config.json'
+
+        with patch('mymt5.client.orjson', None):
+            result = client.save_config(str(filepath))
+
+        assert result is True
+        saved = json.loads(filepath.read_text())
+        assert saved['timeout'] == client.timeout
+        assert 'password' not in saved
+
+    def test_save_config_skips_unserializable(self, client, tmp_path):
+        """Test values the JSON encoder rejects are left out of the file."""
+        filepath = tmp_path / 'config.json'
+        client.configure(callback=object(), custom_setting="value")
+
+        for orjson_module in (mymt5.client.orjson, None):
+            with patch('mymt5.client.orjson', orjson_module):
+                assert client.save_config(str(filepath)) is True
+
+            saved = json.loads(filepath.read_text())
+            assert 'callback' not in saved
+            assert saved['custom_setting'] == "value"
+
+    def test_config_round_trip_without_orjson(self, client, tmp_path):
+        """Test a saved config loads back with the json module fallback."""
+        filepath = tmp_path / 'config.json'
+        client.configure(retry_attempts=7, custom_setting="value")
+        client.save_config(str(filepath))
+
+        new_client = MT5Client()
+        with patch('mymt5.client.orjson', None):
+            result = new_client.load_config(str(filepath))
+
+        assert result is True
+        assert new_client.retry_attempts == 7
+        assert new_client.config['custom_setting'] == "value"
 
 
 # =============================================================================
@@ -482,6 +623,20 @@ class TestEventSystem:
 
         callback.assert_called_once_with(client=client)
 
+    def test_trigger_event_handler_removes_itself(self, client):
+        """Test a callback unregistering itself does not skip later callbacks."""
+        def one_shot(**kwargs):
+            client.off('connect', one_shot)
+
+        callback = Mock()
+        client.on('connect', one_shot)
+        client.on('connect', callback)
+
+        client.trigger_event('connect', client=client)
+
+        callback.assert_called_once_with(client=client)
+        assert client._event_handlers['connect'] == (callback,)
+
     def test_trigger_event_with_exception(self, client):
         """Test triggering event when callback raises exception."""
         callback = Mock(side_effect=Exception("Test error"))
@@ -514,6 +669,15 @@ class TestStatusDiagnostics:
         assert status['account_info']['server'] == "TestServer"
         assert 'statistics' in status
 
+    def test_get_status_queries_terminal_once(self, client, mock_mt5):
+        """Test get_status makes a single terminal_info call."""
+        client.connection_state = ConnectionState.CONNECTED
+
+        status = client.get_status()
+
+        assert status['is_connected'] is True
+        assert mock_mt5['terminal_info'].call_count == 1
+
     def test_get_connection_statistics(self, client):
         """Test getting connection statistics."""
         client._connection_attempts = 10
@@ -529,6 +693,22 @@ class TestStatusDiagnostics:
         assert stats['success_rate'] == 0.8
         assert stats['error_count'] == 3
 
+    def test_last_connection_time(self, client, mock_mt5):
+        """Test the last connection time is recorded on connect."""
+        assert client.last_connection_time is None
+        assert client.get_connection_statistics()['last_connection_time'] is None
+
+        client.initialize()
+
+        assert isinstance(client.last_connection_time, datetime)
+        stats = client.get_connection_statistics()
+        assert stats['last_connection_time'] == client.last_connection_time.isoformat()
+
+        client.reset()
+
+        assert client.last_connection_time is None
+        assert client.get_connection_statistics()['last_connection_time'] is None
+
 
 # =============================================================================
 # ERROR HANDLING TESTS
@@ -552,6 +732,14 @@ class TestErrorHandling:
         assert client._last_error == (10004, "Test error")
         assert client._error_count == 1
 
+    def test_handle_error_logs_code_and_message(self, client):
+        """Test the error log line carries the error code and description."""
+        with patch('mymt5.client.logger') as mock_logger:
+            client.handle_error(10004, "Test error")
+
+        message, *args = mock_logger.error.call_args[0]
+        assert message.format(*args) == "Error 10004: Test error"
+
     def test_handle_error_triggers_event(self, client):
         """Test that error handling triggers error event."""
         callback = Mock()
@@ -584,14 +772,93 @@ class TestUtilityMethods:
         assert client.account_login is None
         assert client._connection_attempts == 0
         assert client._error_count == 0
+        mock_mt5['shutdown'].assert_called_once()
+
+    def test_reset_fresh_client_skips_shutdown(self, client, mock_mt5):
+        """Test resetting a never-initialized client doesn't call MT5."""
+        client.reset()
+
+        assert client.connection_state == ConnectionState.DISCONNECTED
+        mock_mt5['shutdown'].assert_not_called()
+
+    def test_reset_clears_terminal_info_cache(self, client, mock_mt5):
+        """Test reset drops cached terminal info even without a shutdown."""
+        client.ping()
+        client.reset()
+        client.ping()
+
+        assert mock_mt5['terminal_info'].call_count == 2
+
+    def test_reset_after_disconnect_shuts_down(self, client, mock_mt5):
+        """Test reset still shuts MT5 down after a plain disconnect."""
+        client.initialize()
+        client.disconnect()
+
+        client.reset()
+
+        mock_mt5['shutdown'].assert_called_once()
 
     def test_export_logs(self, client):
         """Test exporting logs."""
-        with patch('builtins.open', mock_open()) as mock_file:
+        with patch('builtins.open', mock_open()) as mock_file, \
+             patch('mymt5.client.os.replace') as mock_replace:
             result = client.export_logs('logs.json')
 
         assert result is True
         mock_file.assert_called_once()
+        mock_replace.assert_called_once_with('logs.json.tmp', 'logs.json')
+
+    def test_export_logs_without_orjson_single_write(self, client):
+        """Test the json fallback writes the encoded logs in one call."""
+        with patch('mymt5.client.orjson', None), \
+             patch('builtins.open', mock_open()) as mock_file, \
+             patch('mymt5.client.os.replace'):
+            result = client.export_logs('logs.json')
+
+        assert result is True
+        mock_file().write.assert_called_once()
+        assert json.loads(mock_file().write.call_args[0][0])['saved_accounts'] == []
+
+    def test_export_logs_durable_fsyncs(self, client, mock_mt5, tmp_path):
+        """Test durable exports are fsynced, and plain exports are not."""
+        filepath = tmp_path / 'logs.json'
+
+        with patch('mymt5.client.os.fsync') as mock_fsync:
+            assert client.export_logs(str(filepath)) is True
+            mock_fsync.assert_not_called()
+
+            assert client.export_logs(str(filepath), durable=True) is True
+            mock_fsync.assert_called_once()
+
+        assert json.loads(filepath.read_text())['saved_accounts'] == []
+
+    def test_export_logs_atomic_replace(self, client, mock_mt5, tmp_path):
+        """Test overwriting exports go through a temp file and keep the old file on failure."""
+        filepath = tmp_path / 'logs.json'
+        filepath.write_text('previous')
+
+        assert client.export_logs(str(filepath)) is True
+        assert json.loads(filepath.read_text())['saved_accounts'] == []
+        assert not (tmp_path / 'logs.json.tmp').exists()
+
+        with patch('mymt5.client.os.replace', side_effect=OSError("disk full")):
+            assert client.export_logs(str(filepath)) is False
+
+        assert json.loads(filepath.read_text())['saved_accounts'] == []
+        assert not (tmp_path / 'logs.json.tmp').exists()
+
+    def test_export_logs_append_json_lines(self, client, mock_mt5, tmp_path):
+        """Test appended log exports add one JSON document per line."""
+        filepath = tmp_path / 'logs.jsonl'
+
+        for orjson_module in (mymt5.client.orjson, None):
+            with patch('mymt5.client.orjson', orjson_module):
+                assert client.export_logs(str(filepath), append=True) is True
+
+        lines = filepath.read_text().splitlines()
+        assert len(lines) == 2
+        for line in lines:
+            assert json.loads(line)['saved_accounts'] == []
 
     def test_repr(self, client):
         """Test __repr__ method."""